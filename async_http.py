@@ -0,0 +1,29 @@
+"""
+Small aiohttp helpers shared by the searchers' async code paths.
+"""
+import aiohttp
+from typing import Tuple, Union
+
+
+def client_timeout(timeout: Union[float, Tuple[float, float]]) -> aiohttp.ClientTimeout:
+    """
+    Translate a requests-style timeout into an aiohttp ClientTimeout.
+    
+    Args:
+        timeout: Total timeout in seconds, or a (connect, read) tuple
+        
+    Returns:
+        Equivalent aiohttp.ClientTimeout
+    """
+    if isinstance(timeout, tuple):
+        connect_timeout, read_timeout = timeout
+        return aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+    return aiohttp.ClientTimeout(total=timeout)
+
+
+async def fetch(session: aiohttp.ClientSession, url: str,
+                allow_redirects: bool = True) -> Tuple[int, bytes, str]:
+    """Fetch a URL and return its HTTP status, raw body and text encoding."""
+    async with session.get(url, allow_redirects=allow_redirects) as response:
+        body = await response.read()
+        return response.status, body, response.get_encoding()
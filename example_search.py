@@ -4,8 +4,9 @@ Example script showing how to use the Person Search Tool.
 This demonstrates searching for a person across multiple sources.
 """
 import os
+import logging
 from dotenv import load_dotenv
-from person_search import PersonSearcher
+from person_search import PersonSearcher, configure_logging
 
 
 def main():
@@ -27,33 +28,36 @@ def main():
     # Initialize the person searcher
     searcher = PersonSearcher(tavily_api_key=tavily_api_key)
     
-    # Example 1: Search for a specific person
-    print("\n" + "="*80)
-    print("EXAMPLE 1: Searching for Aruzhan Abil")
-    print("="*80)
-    
-    results = searcher.search(
-        person_name="Aruzhan Abil",
-        university="Columbia",  # Her university affiliation
-        max_results_per_source=10,
-        include_social=False,
-        search_papers=True,
-        search_news=True,
-        search_web=True
-    )
-    
-    # Display summary
-    searcher.print_summary(results)
-    
-    # Display detailed results (first 3 items per category)
-    searcher.print_detailed_results(results, max_display=3)
-    
-    # Save results to JSON file
-    searcher.save_results(results)
-    
-    print("\n✨ Example search complete!")
-    print("\nTo search for a different person, modify this script or run:")
-    print("  python person_search.py")
+    try:
+        # Example 1: Search for a specific person
+        print("\n" + "="*80)
+        print("EXAMPLE 1: Searching for Aruzhan Abil")
+        print("="*80)
+        
+        results = searcher.search(
+            person_name="Aruzhan Abil",
+            university="Columbia",  # Her university affiliation
+            max_results_per_source=10,
+            include_social=False,
+            search_papers=True,
+            search_news=True,
+            search_web=True
+        )
+        
+        # Display summary
+        searcher.print_summary(results)
+        
+        # Display detailed results (first 3 items per category)
+        searcher.print_detailed_results(results, max_display=3)
+        
+        # Save results to JSON file
+        searcher.save_results(results)
+        
+        print("\n✨ Example search complete!")
+        print("\nTo search for a different person, modify this script or run:")
+        print("  python person_search.py")
+    finally:
+        searcher.close()
     
 
 def example_papers_only():
@@ -65,13 +69,16 @@ def example_papers_only():
     print("="*80 + "\n")
     
     searcher = PaperSearcher()
-    results = searcher.search_all("Aruzhan Abil", max_results=5)
-    
-    for source, papers in results.items():
-        if papers:
-            print(f"\n{source}: {len(papers)} papers found")
-            for i, paper in enumerate(papers[:3], 1):
-                print(f"  {i}. {paper['title']} ({paper['year']})")
+    try:
+        results = searcher.search_all("Aruzhan Abil", max_results=5)
+        
+        for source, papers in results.items():
+            if papers:
+                print(f"\n{source}: {len(papers)} papers found")
+                for i, paper in enumerate(papers[:3], 1):
+                    print(f"  {i}. {paper['title']} ({paper['year']})")
+    finally:
+        searcher.close()
 
 
 def example_news_only():
@@ -85,13 +92,16 @@ def example_news_only():
     load_dotenv()
     
     searcher = NewsSearcher()
-    results = searcher.search_all("Aruzhan Abil", university="Columbia")
-    
-    for source, articles in results.items():
-        if articles:
-            print(f"\n{source}: {len(articles)} articles found")
-            for i, article in enumerate(articles[:3], 1):
-                print(f"  {i}. {article['title']}")
+    try:
+        results = searcher.search_all("Aruzhan Abil", university="Columbia")
+        
+        for source, articles in results.items():
+            if articles:
+                print(f"\n{source}: {len(articles)} articles found")
+                for i, article in enumerate(articles[:3], 1):
+                    print(f"  {i}. {article['title']}")
+    finally:
+        searcher.close()
 
 
 def example_custom_search():
@@ -105,21 +115,27 @@ def example_custom_search():
     
     searcher = PersonSearcher(tavily_api_key=tavily_api_key)
     
-    # Search with custom parameters
-    results = searcher.search(
-        person_name="Aruzhan Abil",
-        university=None,  # Don't filter by university
-        max_results_per_source=5,  # Fewer results per source
-        include_social=True,  # Include social media
-        search_papers=True,
-        search_news=False,  # Skip news
-        search_web=True
-    )
-    
-    searcher.print_summary(results)
+    try:
+        # Search with custom parameters
+        results = searcher.search(
+            person_name="Aruzhan Abil",
+            university=None,  # Don't filter by university
+            max_results_per_source=5,  # Fewer results per source
+            include_social=True,  # Include social media
+            search_papers=True,
+            search_news=False,  # Skip news
+            search_web=True
+        )
+        
+        searcher.print_summary(results)
+    finally:
+        searcher.close()
 
 
 if __name__ == "__main__":
+    # Show step-by-step search progress
+    configure_logging(logging.INFO)
+    
     # Run the main example
     main()
     
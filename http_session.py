@@ -0,0 +1,37 @@
+"""
+Pooled requests.Session setup shared by the searchers' blocking code paths.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Tuple
+from urllib3.util.retry import Retry
+
+
+def pooled_session(user_agent: str, pool_connections: int = 10, pool_maxsize: int = 20,
+                   retries: int = 3, backoff_factor: float = 0.5,
+                   status_forcelist: Tuple[int, ...] = (429, 500, 502, 503, 504)) -> requests.Session:
+    """
+    Create a keep-alive session that retries transient failures.
+    
+    Args:
+        user_agent: User-Agent header sent with every request
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Connections kept open per host
+        retries: Total retries for failed requests
+        backoff_factor: Exponential backoff factor between retries
+        status_forcelist: HTTP statuses that are retried
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': user_agent})
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=backoff_factor,
+                          status_forcelist=list(status_forcelist))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -1,15 +1,132 @@
 """
 Main orchestrator for comprehensive person search across multiple sources.
 """
+import contextlib
+import contextvars
+import io
 import os
+import sys
+import logging
+import textwrap
+import re
 import json
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple, Union
 from dotenv import load_dotenv
+import diskcache
+import orjson
 
 from search_papers import PaperSearcher
 from search_news import NewsSearcher
 from search_web import WebSearcher
+from rate_limiter import RateLimiter
+from search_cache import bypass_cache, clear_negative_cache
+
+
+logger = logging.getLogger('person_search')
+
+
+def configure_logging(level: int = logging.WARNING):
+    """
+    Configure console output for search progress messages.
+    
+    Progress is reported through the ``person_search`` and searcher module
+    loggers, so batch runs can silence it by keeping the default WARNING
+    level. Use logging.INFO for the interactive, step-by-step output.
+    
+    Args:
+        level: Logging level for progress messages
+    """
+    logging.basicConfig(level=level, format='%(message)s', stream=sys.stdout)
+
+# Query parameters that only track the click and never change the page
+_TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'ref_src'}
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for duplicate detection (host case, tracking params, trailing slash)."""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        # Malformed, e.g. an unclosed IPv6 bracket; compare it verbatim
+        return url.strip()
+    query = urlencode([
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in _TRACKING_PARAMS and not name.lower().startswith('utm_')
+    ])
+    path = parts.path.rstrip('/')
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+def _title_key(title: str) -> str:
+    """Order-insensitive word set of a title, or '' when too short to be meaningful."""
+    if not title or title == 'N/A':
+        return ''
+    words = sorted(set(re.findall(r'\w+', title.casefold())))
+    return ' '.join(words) if len(words) >= 3 else ''
+
+
+# Spaces become underscores; punctuation and path separators are dropped
+_FILENAME_TRANS = str.maketrans({c: '_' if c == ' ' else '' for c in " .,'\"/\\"})
+
+# (results key, summary key, progress heading, label in the total line)
+_SECTIONS = (
+    ('papers', 'total_papers', "🎓 SEARCHING ACADEMIC PAPERS...", "papers"),
+    ('news', 'total_news_articles', "📰 SEARCHING NEWS ARTICLES...", "news articles"),
+    ('web', 'total_web_results', "🌐 SEARCHING WEB...", "web results"),
+)
+
+
+def _total(container) -> int:
+    """Count result items in a list, or in a (possibly nested) dict of lists."""
+    if isinstance(container, list):
+        return len(container)
+    if isinstance(container, dict):
+        return sum(_total(value) for value in container.values())
+    return 0
+
+
+def _dedupe(items: List[Dict], seen: set, key: str = 'url') -> List[Dict]:
+    """
+    Drop items whose normalized URL or title word set has already been seen.
+    
+    Args:
+        items: Result dictionaries from a single source
+        seen: Keys already emitted; updated in place so it can span sources
+        key: Name of the URL field in each item
+        
+    Returns:
+        Items that were not seen before, in their original order
+    """
+    unique = []
+    for item in items:
+        keys = []
+        url = item.get(key)
+        if url and url != 'N/A':
+            keys.append(('url', _normalize_url(url)))
+        title_key = _title_key(item.get('title'))
+        if title_key:
+            keys.append(('title', title_key))
+        
+        if any(k in seen for k in keys):
+            continue
+        seen.update(keys)
+        unique.append(item)
+    return unique
+
+
+def _dedupe_sources(source_results: Dict, seen: set) -> Dict:
+    """Deduplicate every result list in a source dictionary (including nested dicts)."""
+    for source, items in source_results.items():
+        if isinstance(items, list):
+            source_results[source] = _dedupe(items, seen)
+        elif isinstance(items, dict):
+            _dedupe_sources(items, seen)
+    return source_results
 
 
 class PersonSearcher:
@@ -18,24 +135,43 @@ class PersonSearcher:
     across academic papers, news articles, and web mentions.
     """
     
-    def __init__(self, tavily_api_key: str = None):
+    def __init__(self, tavily_api_key: str = None,
+                 cache_dir: str = './.person_cache',
+                 cache_ttl: int = 3600,
+                 timeout: Union[float, Tuple[float, float]] = 10.0,
+                 rate_limiter: RateLimiter = None):
         """
         Initialize the person searcher.
         
         Args:
             tavily_api_key: Optional Tavily API key for enhanced web search capabilities
+            cache_dir: Directory for the on-disk cache of completed searches;
+                the per-source caches are kept in its ``sources`` subdirectory
+            cache_ttl: Seconds a cached search stays valid
+            timeout: HTTP timeout in seconds, or a (connect, read) tuple,
+                applied to every source so one slow host cannot stall the search
+            rate_limiter: Limiter paced before every Tavily call; pass the same
+                instance to several PersonSearchers to share one budget
+                (default: the process-wide Tavily limiter). SerpAPI calls
+                keep their own process-wide limiter.
         """
         self.tavily_api_key = tavily_api_key
-        self.paper_searcher = PaperSearcher()
-        self.news_searcher = NewsSearcher(serpapi_key=None)  # News uses basic search or Tavily
-        self.web_searcher = WebSearcher(tavily_api_key=tavily_api_key)
+        self.cache_ttl = cache_ttl
+        self._cache = diskcache.Cache(cache_dir)
+        self._sources_cache_dir = os.path.join(cache_dir, 'sources')
+        self.paper_searcher = PaperSearcher(timeout=timeout, cache_dir=self._sources_cache_dir)
+        self.news_searcher = NewsSearcher(serpapi_key=None, timeout=timeout,
+                                          cache_dir=self._sources_cache_dir)  # News uses basic search or Tavily
+        self.web_searcher = WebSearcher(tavily_api_key=tavily_api_key, timeout=timeout,
+                                        rate_limiter=rate_limiter, cache_dir=self._sources_cache_dir)
     
     def search(self, person_name: str, university: str = None,
                max_results_per_source: int = 10,
                include_social: bool = False,
                search_papers: bool = True,
                search_news: bool = True,
-               search_web: bool = True) -> Dict:
+               search_web: bool = True,
+               use_cache: bool = True) -> Dict:
         """
         Perform comprehensive search for a person.
         
@@ -47,14 +183,31 @@ class PersonSearcher:
             search_papers: Whether to search for academic papers
             search_news: Whether to search for news articles
             search_web: Whether to perform general web search
+            use_cache: Whether to reuse (and store) results from the on-disk cache;
+                when False, the per-source search and negative caches are
+                skipped as well, so every source is queried afresh
             
         Returns:
             Dictionary containing all search results organized by category
         """
-        print("="*80)
-        print(f"COMPREHENSIVE SEARCH FOR: {person_name}")
-        print("="*80)
-        print()
+        logger.info("%s\nCOMPREHENSIVE SEARCH FOR: %s\n%s\n", "="*80, person_name, "="*80)
+        
+        cache_key = None
+        if use_cache:
+            cache_key = self._cache_key(
+                name=person_name,
+                uni=university,
+                max_results=max_results_per_source,
+                include_social=include_social,
+                papers=search_papers,
+                news=search_news,
+                web=search_web,
+                tavily=bool(self.tavily_api_key)
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.info("♻️  Using cached results from %s", cached['search_timestamp'])
+                return cached
         
         results = {
             'person_name': person_name,
@@ -65,60 +218,91 @@ class PersonSearcher:
             'summary': {}
         }
         
-        # Search academic papers
-        if search_papers:
-            print("\n" + "🎓 SEARCHING ACADEMIC PAPERS...")
-            print("="*80)
-            try:
-                paper_results = self.paper_searcher.search_all(person_name, max_results_per_source)
-                results['papers'] = paper_results
-                
-                total_papers = sum(len(papers) for papers in paper_results.values())
-                results['summary']['total_papers'] = total_papers
-                print(f"\n✅ Total papers found: {total_papers}")
-            except Exception as e:
-                print(f"❌ Error searching papers: {e}")
-                results['papers']['error'] = str(e)
+        # Each source is network-bound, so run them concurrently and report
+        # afterwards in a fixed order to keep the console output readable.
+        # Failed sources come back as None so an incomplete search is not cached.
+        # Without the cache, the sub-searchers' memoized results are skipped too;
+        # each worker runs in a copy of this context so the bypass reaches it.
+        with (contextlib.nullcontext() if use_cache else bypass_cache(),
+              ThreadPoolExecutor(max_workers=3) as executor):
+            def submit(fn, *args, **kwargs):
+                return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+            
+            futures = {}
+            if search_papers:
+                futures['papers'] = submit(
+                    self.paper_searcher.search_all, person_name, max_results_per_source,
+                    keep_failures=True)
+            if search_news:
+                futures['news'] = submit(
+                    self.news_searcher.search_all, person_name, university, max_results_per_source,
+                    keep_failures=True)
+            if search_web:
+                futures['web'] = submit(
+                    self.web_searcher.search_all, person_name, max_results_per_source, include_social,
+                    keep_failures=True)
         
-        # Search news articles
-        if search_news:
-            print("\n" + "📰 SEARCHING NEWS ARTICLES...")
-            print("="*80)
-            try:
-                news_results = self.news_searcher.search_all(person_name, university, max_results_per_source)
-                results['news'] = news_results
-                
-                total_articles = sum(len(articles) for articles in news_results.values())
-                results['summary']['total_news_articles'] = total_articles
-                print(f"\n✅ Total news articles found: {total_articles}")
-            except Exception as e:
-                print(f"❌ Error searching news: {e}")
-                results['news']['error'] = str(e)
+        output = io.StringIO()
+        # Shared across sections so the same link reported by several sources
+        # is kept only once (papers first, then news, then web).
+        seen = set()
+        complete = True
         
-        # Search web
-        if search_web:
-            print("\n" + "🌐 SEARCHING WEB...")
-            print("="*80)
+        for section, summary_key, heading, label in _SECTIONS:
+            if section not in futures:
+                continue
+            
+            output.write(f"\n{heading}\n")
+            output.write("="*80 + "\n")
             try:
-                web_results = self.web_searcher.search_all(person_name, max_results_per_source, include_social)
-                results['web'] = web_results
+                section_results = futures[section].result()
+                for source, items in section_results.items():
+                    if items is None:
+                        complete = False
+                        output.write(f"⚠ Search failed: {source.replace('_', ' ').title()}\n")
+                        section_results[source] = {} if source == 'social_media' else []
                 
-                total_web_results = 0
-                if 'general_search' in web_results:
-                    total_web_results += len(web_results['general_search'])
-                if 'podcasts_interviews' in web_results:
-                    total_web_results += len(web_results['podcasts_interviews'])
-                if 'social_media' in web_results:
-                    total_web_results += sum(len(items) for items in web_results['social_media'].values())
+                section_results = _dedupe_sources(section_results, seen)
+                results[section] = section_results
                 
-                results['summary']['total_web_results'] = total_web_results
-                print(f"\n✅ Total web results found: {total_web_results}")
+                results['summary'][summary_key] = _total(section_results)
+                output.write(f"\n✅ Total {label} found: {results['summary'][summary_key]}\n")
             except Exception as e:
-                print(f"❌ Error searching web: {e}")
-                results['web']['error'] = str(e)
+                complete = False
+                output.write(f"❌ Error searching {section}: {e}\n")
+                results[section]['error'] = str(e)
+        
+        # Log the whole block at once so concurrent output cannot interleave
+        logger.info(output.getvalue().rstrip('\n'))
+        
+        # Only cache complete searches so a transient failure is retried next time
+        if cache_key and complete:
+            self._cache.set(cache_key, results, expire=self.cache_ttl)
         
         return results
     
+    def close(self):
+        """Close the sub-searchers' HTTP connections and the result cache."""
+        self.paper_searcher.close()
+        self.news_searcher.close()
+        self.web_searcher.close()
+        self._cache.close()
+    
+    def clear_negative_cache(self) -> int:
+        """
+        Forget every remembered empty search so all sources are queried again.
+        
+        Returns:
+            Number of entries removed
+        """
+        return clear_negative_cache(self._sources_cache_dir)
+    
+    @staticmethod
+    def _cache_key(**params) -> str:
+        """Build a stable cache key from the search parameters."""
+        payload = json.dumps(params, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
     def print_summary(self, results: Dict):
         """
         Print a formatted summary of search results.
@@ -126,34 +310,38 @@ class PersonSearcher:
         Args:
             results: Dictionary containing search results
         """
-        print("\n" + "="*80)
-        print(f"📊 SEARCH SUMMARY FOR: {results['person_name']}")
-        print("="*80)
+        lines = []
+        lines.append("\n" + "="*80)
+        lines.append(f"📊 SEARCH SUMMARY FOR: {results['person_name']}")
+        lines.append("="*80)
         
         summary = results.get('summary', {})
         
-        print(f"\n🎓 Academic Papers: {summary.get('total_papers', 0)}")
+        lines.append(f"\n🎓 Academic Papers: {summary.get('total_papers', 0)}")
         if results.get('papers'):
             for source, papers in results['papers'].items():
                 if isinstance(papers, list):
-                    print(f"   • {source.replace('_', ' ').title()}: {len(papers)}")
+                    lines.append(f"   • {source.replace('_', ' ').title()}: {len(papers)}")
         
-        print(f"\n📰 News Articles: {summary.get('total_news_articles', 0)}")
+        lines.append(f"\n📰 News Articles: {summary.get('total_news_articles', 0)}")
         if results.get('news'):
             for source, articles in results['news'].items():
                 if isinstance(articles, list):
-                    print(f"   • {source.replace('_', ' ').title()}: {len(articles)}")
+                    lines.append(f"   • {source.replace('_', ' ').title()}: {len(articles)}")
         
-        print(f"\n🌐 Web Results: {summary.get('total_web_results', 0)}")
+        lines.append(f"\n🌐 Web Results: {summary.get('total_web_results', 0)}")
         if results.get('web'):
             for source, items in results['web'].items():
                 if isinstance(items, list):
-                    print(f"   • {source.replace('_', ' ').title()}: {len(items)}")
+                    lines.append(f"   • {source.replace('_', ' ').title()}: {len(items)}")
                 elif isinstance(items, dict):
                     for platform, platform_items in items.items():
-                        print(f"   • {platform}: {len(platform_items)}")
+                        lines.append(f"   • {platform}: {len(platform_items)}")
         
-        print("\n" + "="*80)
+        lines.append("\n" + "="*80)
+        
+        # One write for the whole report instead of a syscall per line
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def print_detailed_results(self, results: Dict, max_display: int = 5):
         """
@@ -163,93 +351,122 @@ class PersonSearcher:
             results: Dictionary containing search results
             max_display: Maximum number of items to display per category
         """
-        print("\n" + "="*80)
-        print(f"📋 DETAILED RESULTS FOR: {results['person_name']}")
-        print("="*80)
+        sys.stdout.writelines(f"{line}\n" for line in self._iter_detail_lines(results, max_display))
+    
+    def _iter_detail_lines(self, results: Dict, max_display: int = 5) -> Iterator[str]:
+        """
+        Yield the lines of the detailed results report one at a time.
+        
+        Args:
+            results: Dictionary containing search results
+            max_display: Maximum number of items to display per category
+            
+        Yields:
+            Formatted report lines (without trailing newlines)
+        """
+        yield "\n" + "="*80
+        yield f"📋 DETAILED RESULTS FOR: {results['person_name']}"
+        yield "="*80
         
         # Academic Papers
         if results.get('papers'):
-            print("\n🎓 ACADEMIC PAPERS")
-            print("-"*80)
+            yield "\n🎓 ACADEMIC PAPERS"
+            yield "-"*80
             for source, papers in results['papers'].items():
                 if isinstance(papers, list) and papers:
-                    print(f"\n{source.upper().replace('_', ' ')}:")
+                    yield f"\n{source.upper().replace('_', ' ')}:"
                     for i, paper in enumerate(papers[:max_display], 1):
-                        print(f"\n{i}. {paper.get('title', 'N/A')}")
-                        print(f"   Authors: {paper.get('authors', 'N/A')}")
-                        print(f"   Year: {paper.get('year', 'N/A')}")
-                        print(f"   Venue: {paper.get('venue', 'N/A')}")
-                        if paper.get('citations') != 'N/A':
-                            print(f"   Citations: {paper.get('citations', 0)}")
-                        print(f"   URL: {paper.get('url', 'N/A')}")
-                        if paper.get('abstract') and paper['abstract'] != 'N/A':
-                            abstract = paper['abstract'][:200] + "..." if len(paper['abstract']) > 200 else paper['abstract']
-                            print(f"   Abstract: {abstract}")
+                        get = paper.get
+                        title, authors, year, venue = get('title', 'N/A'), get('authors', 'N/A'), get('year', 'N/A'), get('venue', 'N/A')
+                        citations, url, abstract = get('citations', 0), get('url', 'N/A'), get('abstract')
+                        
+                        yield f"\n{i}. {title}"
+                        yield f"   Authors: {authors}"
+                        yield f"   Year: {year}"
+                        yield f"   Venue: {venue}"
+                        if citations != 'N/A':
+                            yield f"   Citations: {citations}"
+                        yield f"   URL: {url}"
+                        if abstract and abstract != 'N/A':
+                            yield f"   Abstract: {textwrap.shorten(abstract, width=200, placeholder='...')}"
         
         # News Articles
         if results.get('news'):
-            print("\n\n📰 NEWS ARTICLES")
-            print("-"*80)
+            yield "\n\n📰 NEWS ARTICLES"
+            yield "-"*80
             for source, articles in results['news'].items():
                 if isinstance(articles, list) and articles:
-                    print(f"\n{source.upper().replace('_', ' ')}:")
+                    yield f"\n{source.upper().replace('_', ' ')}:"
                     for i, article in enumerate(articles[:max_display], 1):
-                        print(f"\n{i}. {article.get('title', 'N/A')}")
-                        print(f"   Source: {article.get('source', 'N/A')}")
-                        print(f"   Date: {article.get('date', 'N/A')}")
-                        print(f"   URL: {article.get('url', 'N/A')}")
-                        if article.get('snippet') and article['snippet'] != 'N/A':
-                            snippet = article['snippet'][:150] + "..." if len(article['snippet']) > 150 else article['snippet']
-                            print(f"   Snippet: {snippet}")
+                        get = article.get
+                        title, source_name, date = get('title', 'N/A'), get('source', 'N/A'), get('date', 'N/A')
+                        url, snippet = get('url', 'N/A'), get('snippet')
+                        
+                        yield f"\n{i}. {title}"
+                        yield f"   Source: {source_name}"
+                        yield f"   Date: {date}"
+                        yield f"   URL: {url}"
+                        if snippet and snippet != 'N/A':
+                            yield f"   Snippet: {textwrap.shorten(snippet, width=150, placeholder='...')}"
         
         # Web Results
         if results.get('web'):
-            print("\n\n🌐 WEB RESULTS")
-            print("-"*80)
+            yield "\n\n🌐 WEB RESULTS"
+            yield "-"*80
             for source, items in results['web'].items():
                 if isinstance(items, list) and items:
-                    print(f"\n{source.upper().replace('_', ' ')}:")
+                    yield f"\n{source.upper().replace('_', ' ')}:"
                     for i, item in enumerate(items[:max_display], 1):
-                        print(f"\n{i}. {item.get('title', 'N/A')}")
-                        print(f"   URL: {item.get('url', 'N/A')}")
-                        if item.get('snippet') and item['snippet'] != 'N/A':
-                            snippet = item['snippet'][:150] + "..." if len(item['snippet']) > 150 else item['snippet']
-                            print(f"   Snippet: {snippet}")
+                        get = item.get
+                        title, url, snippet = get('title', 'N/A'), get('url', 'N/A'), get('snippet')
+                        
+                        yield f"\n{i}. {title}"
+                        yield f"   URL: {url}"
+                        if snippet and snippet != 'N/A':
+                            yield f"   Snippet: {textwrap.shorten(snippet, width=150, placeholder='...')}"
                 elif isinstance(items, dict):
                     for platform, platform_items in items.items():
                         if platform_items:
-                            print(f"\n{platform.upper()}:")
+                            yield f"\n{platform.upper()}:"
                             for i, item in enumerate(platform_items[:max_display], 1):
-                                print(f"\n{i}. {item.get('title', 'N/A')}")
-                                print(f"   URL: {item.get('url', 'N/A')}")
+                                get = item.get
+                                title, url = get('title', 'N/A'), get('url', 'N/A')
+                                
+                                yield f"\n{i}. {title}"
+                                yield f"   URL: {url}"
         
-        print("\n" + "="*80)
+        yield "\n" + "="*80
     
-    def save_results(self, results: Dict, filename: str = None):
+    def save_results(self, results: Dict, filename: str = None, pretty: bool = True):
         """
         Save search results to a JSON file.
         
         Args:
             results: Dictionary containing search results
             filename: Optional custom filename (default: person_name_timestamp.json)
+            pretty: Indent the JSON output; disable for compact, faster batch saves
         """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            person_name_clean = results['person_name'].replace(' ', '_').lower()
+            person_name_clean = results['person_name'].casefold().translate(_FILENAME_TRANS)
             filename = f"search_results_{person_name_clean}_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-            print(f"\n💾 Results saved to: {filename}")
+            # orjson serializes the result dataclasses (e.g. NewsArticle) natively
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            Path(filename).write_bytes(orjson.dumps(results, option=option))
+            logger.info("\n💾 Results saved to: %s", filename)
         except Exception as e:
-            print(f"\n❌ Error saving results: {e}")
+            logger.error("\n❌ Error saving results: %s", e)
 
 
 def main():
     """Main function to run the person search."""
     # Load environment variables
     load_dotenv()
+    configure_logging(logging.INFO)
     
     # Get API key from environment
     tavily_api_key = os.getenv('TAVILY_API_KEY')
@@ -263,29 +480,32 @@ def main():
     # Initialize searcher
     searcher = PersonSearcher(tavily_api_key=tavily_api_key)
     
-    # Example: Search for Aruzhan Abil
-    person_name = "Aruzhan Abil"
-    university = "Columbia"  # Her university affiliation
-    
-    # Perform comprehensive search
-    results = searcher.search(
-        person_name=person_name,
-        university=university,
-        max_results_per_source=10,
-        include_social=False,  # Set to True to include social media
-        search_papers=True,
-        search_news=True,
-        search_web=True
-    )
-    
-    # Print summary
-    searcher.print_summary(results)
-    
-    # Print detailed results
-    searcher.print_detailed_results(results, max_display=5)
-    
-    # Save results to file
-    searcher.save_results(results)
+    try:
+        # Example: Search for Aruzhan Abil
+        person_name = "Aruzhan Abil"
+        university = "Columbia"  # Her university affiliation
+        
+        # Perform comprehensive search
+        results = searcher.search(
+            person_name=person_name,
+            university=university,
+            max_results_per_source=10,
+            include_social=False,  # Set to True to include social media
+            search_papers=True,
+            search_news=True,
+            search_web=True
+        )
+        
+        # Print summary
+        searcher.print_summary(results)
+        
+        # Print detailed results
+        searcher.print_detailed_results(results, max_display=5)
+        
+        # Save results to file
+        searcher.save_results(results)
+    finally:
+        searcher.close()
     
     print("\n✨ Search complete!")
 
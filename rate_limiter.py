@@ -0,0 +1,62 @@
+"""
+Token-bucket rate limiting shared across searchers.
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing `max_calls` requests per `period` seconds.
+    
+    A single instance can be shared by several searchers (and threads) so that
+    together they stay under a provider's quota. Use it as a context manager
+    around each rate-limited call.
+    """
+    
+    def __init__(self, max_calls: int, period: float):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            max_calls: Number of calls allowed per period (also the burst size)
+            period: Length of the period in seconds
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self._rate = max_calls / period
+        self._tokens = float(max_calls)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a call is allowed, then consume one token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.max_calls, self._tokens + (now - self._last) * self._rate)
+                self._last = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self._rate
+            
+            time.sleep(wait)
+    
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+# Tavily's documented limit; shared by default so every WebSearcher in the
+# process draws from the same budget.
+TAVILY_RATE_LIMITER = RateLimiter(max_calls=20, period=60)
+
+# SerpAPI quotas are monthly with no documented per-second limit, so this only
+# keeps concurrent NewsSearchers from bursting; shared process-wide as well.
+SERPAPI_RATE_LIMITER = RateLimiter(max_calls=5, period=1)
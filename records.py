@@ -0,0 +1,24 @@
+"""
+Shared helpers for the search result record types.
+"""
+
+
+class RecordMixin:
+    """
+    Read-only dict-style access for slotted result dataclasses.
+    
+    Result records used to be plain dictionaries, so callers index them with
+    ``record['title']`` and ``record.get('title', 'N/A')``. This keeps that
+    working while the records themselves stay compact.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
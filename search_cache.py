@@ -0,0 +1,268 @@
+"""
+On-disk memoization for individual search calls.
+"""
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import hashlib
+import inspect
+import json
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+import diskcache
+
+
+DEFAULT_CACHE_DIR = './.search_cache'
+
+# diskcache tag marking remembered empty results, so they can be evicted alone
+NEGATIVE_TAG = 'negative'
+
+_caches: Dict[str, diskcache.Cache] = {}
+_caches_lock = threading.Lock()
+
+# Set by bypass_cache(); a context variable so concurrent searches don't interfere
+_bypass: contextvars.ContextVar = contextvars.ContextVar('search_cache_bypass', default=False)
+
+
+def name_key(person_name: str) -> str:
+    """Normalize a person's name for use in cache keys."""
+    return ' '.join(person_name.casefold().split())
+
+
+def _get_cache(cache_dir: str) -> diskcache.Cache:
+    """Open (once per process) the cache stored in `cache_dir`."""
+    with _caches_lock:
+        if cache_dir not in _caches:
+            _caches[cache_dir] = diskcache.Cache(cache_dir)
+        return _caches[cache_dir]
+
+
+@contextlib.contextmanager
+def bypass_cache():
+    """
+    Skip cached results for searches run inside this block.
+    
+    Memoized searches (and recently_empty) ignore what is already stored but still record fresh results. The setting follows the
+    current context into tasks and `asyncio.to_thread` workers; work handed to
+    a plain thread pool must be run with `contextvars.copy_context().run`.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def remember_empty(key, ttl: int, cache_dir: str = DEFAULT_CACHE_DIR) -> None:
+    """
+    Record that the search identified by `key` found nothing.
+    
+    Stored alongside (and cleared with) disk_memoize's empty results, for
+    searches that are not a single memoizable call.
+    
+    Args:
+        key: Hashable, picklable key identifying the search
+        ttl: Seconds to remember the empty result
+        cache_dir: Directory holding the cache
+    """
+    _get_cache(cache_dir).set(key, True, expire=ttl, tag=NEGATIVE_TAG)
+
+
+def recently_empty(key, cache_dir: str = DEFAULT_CACHE_DIR) -> bool:
+    """Whether remember_empty(key) is still in effect (always False inside bypass_cache())."""
+    return not _bypass.get() and bool(_get_cache(cache_dir).get(key))
+
+
+def clear_negative_cache(cache_dir: str = DEFAULT_CACHE_DIR) -> int:
+    """
+    Forget every remembered empty search so all sources are queried again.
+    
+    This covers empty results kept through `negative_ttl` and remember_empty.
+    Non-empty results stay cached.
+    
+    Args:
+        cache_dir: Directory holding the cache
+        
+    Returns:
+        Number of entries removed
+    """
+    return _get_cache(cache_dir).evict(NEGATIVE_TAG)
+
+
+def disk_memoize(ttl: int = 3600, key_attrs: Tuple[str, ...] = (),
+                 cache_dir: str = DEFAULT_CACHE_DIR, name: Optional[str] = None,
+                 ignore: Tuple[str, ...] = (), negative_ttl: Optional[int] = None) -> Callable:
+    """
+    Cache a search method's results on disk for `ttl` seconds.
+    
+    The cache key is built from the method name, its bound arguments (with
+    `person_name` normalized for case and whitespace) and the values of
+    `key_attrs` on the instance, e.g. whether an API key is configured.
+    Entries live in the instance's `cache_dir` attribute when it has one, so
+    each searcher can be pointed at its own directory.
+    By default only non-empty results are cached. Searchers that return None
+    on failure (instead of an empty list) can pass `negative_ttl` to also
+    remember empty results, so a name with nothing to find is not searched
+    again for that long; None itself is never cached. Inside bypass_cache()
+    stored entries are ignored, though fresh results are still saved.
+    Coroutine methods are supported as well.
+    
+    Args:
+        ttl: Seconds a cached result stays valid
+        key_attrs: Instance attributes that change what the method returns
+        cache_dir: Directory holding the cache when the instance has no
+            `cache_dir` attribute
+        name: Cache under this name instead of the method's, so a sync and an
+            async variant of the same search can share entries
+        ignore: Arguments left out of the key, e.g. a per-call HTTP session
+        negative_ttl: Seconds to remember an empty (but not None) result
+        
+    Returns:
+        Decorator for searcher methods
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        
+        def cache_key(self, args, kwargs) -> str:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {
+                arg: value for arg, value in bound.arguments.items()
+                if arg != 'self' and arg not in ignore
+            }
+            if isinstance(arguments.get('person_name'), str):
+                arguments['person_name'] = name_key(arguments['person_name'])
+            
+            payload = json.dumps({
+                'func': name or func.__qualname__,
+                'args': arguments,
+                'attrs': {attr: getattr(self, attr, None) for attr in key_attrs}
+            }, sort_keys=True, default=str)
+            return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        
+        def store(cache: diskcache.Cache, key: str, result) -> None:
+            if result:
+                cache.set(key, result, expire=ttl)
+            elif result is not None and negative_ttl:
+                cache.set(key, result, expire=negative_ttl, tag=NEGATIVE_TAG)
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                key = cache_key(self, args, kwargs)
+                cache = _get_cache(getattr(self, 'cache_dir', None) or cache_dir)
+                cached = None if _bypass.get() else cache.get(key)
+                if cached is not None:
+                    return cached
+                
+                result = await func(self, *args, **kwargs)
+                store(cache, key, result)
+                return result
+            
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = cache_key(self, args, kwargs)
+            cache = _get_cache(getattr(self, 'cache_dir', None) or cache_dir)
+            cached = None if _bypass.get() else cache.get(key)
+            if cached is not None:
+                return cached
+            
+            result = func(self, *args, **kwargs)
+            store(cache, key, result)
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+def single_flight(key_fn: Callable) -> Callable:
+    """
+    Coalesce concurrent calls that would run the same search.
+    
+    While a call is in flight, further calls with the same `key_fn(*args,
+    **kwargs)` wait for it and share its result (or exception) instead of
+    issuing their own request. In-flight calls are tracked per process, so
+    this works across threads and across event loops, e.g. several threads
+    each running their own `asyncio.run`.
+    
+    Args:
+        key_fn: Maps the method's arguments to a hashable key
+        
+    Returns:
+        Decorator for searcher methods
+    """
+    def decorator(func: Callable) -> Callable:
+        futures: Dict[object, concurrent.futures.Future] = {}
+        lock = threading.Lock()
+        
+        def claim(key) -> Tuple[concurrent.futures.Future, bool]:
+            with lock:
+                future = futures.get(key)
+                if future is not None:
+                    return future, False
+                future = futures[key] = concurrent.futures.Future()
+                return future, True
+        
+        def release(key) -> None:
+            with lock:
+                del futures[key]
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = key_fn(*args, **kwargs)
+                while True:
+                    future, leader = claim(key)
+                    if leader:
+                        break
+                    try:
+                        # Shielded so one caller's cancellation doesn't cancel the rest
+                        return await asyncio.shield(asyncio.wrap_future(future))
+                    except asyncio.CancelledError:
+                        if not future.cancelled():
+                            raise
+                        # The leader was cancelled, not us: run the search ourselves
+                
+                try:
+                    result = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except BaseException as e:
+                    future.set_exception(e)
+                    raise
+                else:
+                    future.set_result(result)
+                    return result
+                finally:
+                    release(key)
+            
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = key_fn(*args, **kwargs)
+            future, leader = claim(key)
+            if not leader:
+                return future.result()
+            
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                release(key)
+        
+        return wrapper
+    
+    return decorator
@@ -1,25 +1,132 @@
 """
 Module for searching news articles and media mentions.
 """
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
-import time
+import asyncio
+import logging
+import re
+import aiohttp
+from dataclasses import dataclass
+from selectolax.lexbor import LexborHTMLParser
+from typing import List, Dict, Optional, Tuple, Union
+from urllib.parse import quote_plus, urljoin
+
+try:
+    from serpapi import GoogleSearch
+except ImportError:
+    GoogleSearch = None
+
+from async_http import client_timeout, fetch
+from http_session import pooled_session
+from rate_limiter import RateLimiter, SERPAPI_RATE_LIMITER
+from records import RecordMixin
+from search_cache import DEFAULT_CACHE_DIR, name_key as _name_key, recently_empty, remember_empty
+
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+_UNI_HEADERS = {'User-Agent': USER_AGENT}
+
+# University news site search URLs (the query is appended to each)
+_UNIVERSITY_SITES = {
+    'columbia': 'https://news.columbia.edu/?s=',
+    'mit': 'https://news.mit.edu/search/',
+    'stanford': 'https://news.stanford.edu/search/',
+    'harvard': 'https://news.harvard.edu/gazette/?s='
+}
+
+# Navigation, anchor and listing links that never point at an article
+_BOILERPLATE_HREF_RE = re.compile(r'^(#|mailto:|tel:|javascript:)|/(tag|tags|category|author|search)/', re.I)
+
+# ASCII letter/digit runs of a name; punctuation between them (O'Brien) may be
+# entity-encoded in raw HTML, but the runs themselves appear verbatim
+_NAME_TOKEN_RE = re.compile(r'[A-Za-z0-9]+')
+
+# Upper bound on simultaneous university site requests
+MAX_CONCURRENT_REQUESTS = 8
+
+# Largest number of news results SerpAPI returns per page
+_SERPAPI_PAGE_SIZE = 10
+
+
+@dataclass(slots=True)
+class NewsArticle(RecordMixin):
+    """A single news article or media mention."""
+    title: str
+    source: str
+    date: str
+    snippet: str
+    url: str
+    thumbnail: str
+    search_type: str
+
+
+def _serpapi_article(item: Dict) -> 'NewsArticle':
+    """Build a NewsArticle from a SerpAPI news result."""
+    return NewsArticle(
+        title=item.get('title', 'N/A'),
+        source=item.get('source', {}).get('name', 'N/A'),
+        date=item.get('date', 'N/A'),
+        snippet=item.get('snippet', 'N/A'),
+        url=item.get('link', 'N/A'),
+        thumbnail=item.get('thumbnail', 'N/A'),
+        search_type='Google News'
+    )
+
+
+def _name_prefilter(person_name: str) -> Optional[re.Pattern]:
+    """
+    Bytes pattern that any page mentioning `person_name` must match.
+    
+    Only the longest alphanumeric run of the name is scanned for, since the
+    rest of it (apostrophes, spacing) can be written as HTML entities. Returns
+    None for non-ASCII names: bytes-level IGNORECASE only folds ASCII.
+    """
+    tokens = _NAME_TOKEN_RE.findall(person_name)
+    if not person_name.isascii() or not tokens:
+        return None
+    return re.compile(re.escape(max(tokens, key=len).encode('ascii')), re.IGNORECASE)
 
 
 class NewsSearcher:
     """Search for news articles and media mentions of a person."""
     
-    def __init__(self, serpapi_key: str = None):
+    def __init__(self, serpapi_key: str = None,
+                 timeout: Union[float, Tuple[float, float]] = 10.0,
+                 rate_limiter: RateLimiter = None,
+                 cache_dir: str = DEFAULT_CACHE_DIR,
+                 neg_cache_ttl: int = 86400):
         """
         Initialize the news searcher.
         
         Args:
             serpapi_key: Optional API key for SerpAPI (for Google News search)
+            timeout: HTTP timeout in seconds, or a (connect, read) tuple
+            rate_limiter: Limiter paced before every SerpAPI call
+                (default: the process-wide SerpAPI limiter)
+            cache_dir: Search cache directory, which also remembers
+                searches that found nothing
+            neg_cache_ttl: Seconds to skip a source after it found nothing
         """
         self.serpapi_key = serpapi_key
+        self._base_params = {"tbm": "nws", "api_key": serpapi_key}  # News search
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or SERPAPI_RATE_LIMITER
+        self.cache_dir = cache_dir
+        self.neg_cache_ttl = neg_cache_ttl
+        
+        # Reuse keep-alive connections across requests (and threads) instead
+        # of paying a fresh TCP/TLS handshake on every call.
+        self._session = pooled_session(USER_AGENT, pool_connections=16, pool_maxsize=32,
+                                       retries=2, backoff_factor=0.3,
+                                       status_forcelist=(429, 502, 503, 504))
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        self._session.close()
     
-    def search_google_news(self, person_name: str, max_results: int = 10) -> List[Dict]:
+    def search_google_news(self, person_name: str, max_results: int = 10) -> List[NewsArticle]:
         """
         Search Google News for mentions of a person.
         
@@ -28,122 +135,157 @@ class NewsSearcher:
             max_results: Maximum number of results to return
             
         Returns:
-            List of dictionaries containing news article information
+            List of NewsArticle records
+        """
+        return self._google_news(person_name, max_results) or []
+    
+    def _google_news(self, person_name: str, max_results: int = 10) -> Optional[List[NewsArticle]]:
+        """
+        search_google_news, but returns None if the search failed.
+        """
+        cache_key = ('gnews', 'serpapi' if self.serpapi_key else 'basic', _name_key(person_name))
+        if recently_empty(cache_key, self.cache_dir):
+            logger.info("ℹ Skipping Google News for %s (no results on a recent search)", person_name)
+            return []
+        
+        articles = self._search_google_news(person_name, max_results)
+        if articles is None:
+            return None
+        
+        if not articles:
+            remember_empty(cache_key, self.neg_cache_ttl, self.cache_dir)
+        return articles
+    
+    def _search_google_news(self, person_name: str, max_results: int = 10) -> Optional[List[NewsArticle]]:
+        """
+        Search Google News via SerpAPI, falling back to scraping.
+        
+        When a SerpAPI key is configured but SerpAPI could not be used, an
+        empty scrape is reported as a failure: it says nothing about what
+        SerpAPI would have found, so it must not land in the negative cache.
+        
+        Returns:
+            List of NewsArticle records, or None if the search failed
         """
         articles = []
         
         if not self.serpapi_key:
-            print("⚠ No SerpAPI key provided. Using basic search (limited results).")
+            logger.warning("⚠ No SerpAPI key provided. Using basic search (limited results).")
             return self._search_google_news_basic(person_name, max_results)
         
+        if GoogleSearch is None:
+            logger.error("❌ SerpAPI library not installed. Run: pip install google-search-results")
+            return self._search_google_news_basic(person_name, max_results) or None
+        
         try:
-            print(f"🔍 Searching Google News for {person_name}...")
+            logger.info("🔍 Searching Google News for %s...", person_name)
             
-            from serpapi import GoogleSearch
-            
-            params = {
-                "q": f'"{person_name}"',
-                "tbm": "nws",  # News search
-                "api_key": self.serpapi_key,
-                "num": max_results
-            }
-            
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            
-            news_results = results.get("news_results", [])
+            # Request only as many results as needed, one page at a time, and
+            # stop as soon as we have enough or the results run out
+            news_results = []
+            while len(news_results) < max_results:
+                page_size = min(max_results - len(news_results), _SERPAPI_PAGE_SIZE)
+                params = {
+                    **self._base_params,
+                    "q": f'"{person_name}"',
+                    "num": page_size,
+                    "start": len(news_results)
+                }
+                
+                search = GoogleSearch(params)
+                self.rate_limiter.acquire()
+                data = search.get_dict()
+                # Quota and key errors come back as an error payload rather than
+                # an exception; a search that merely found nothing still has
+                # status Success, so only the former is treated as a failure
+                if 'error' in data and data.get('search_metadata', {}).get('status') != 'Success':
+                    raise RuntimeError(data['error'])
+                page = data.get("news_results", [])[:page_size]
+                
+                news_results.extend(page)
+                if len(page) < page_size:
+                    break
             
             if news_results:
-                print(f"✓ Found {len(news_results)} news articles")
+                logger.info("✓ Found %d news articles", len(news_results))
                 
-                for item in news_results:
-                    article_info = {
-                        'title': item.get('title', 'N/A'),
-                        'source': item.get('source', {}).get('name', 'N/A'),
-                        'date': item.get('date', 'N/A'),
-                        'snippet': item.get('snippet', 'N/A'),
-                        'url': item.get('link', 'N/A'),
-                        'thumbnail': item.get('thumbnail', 'N/A'),
-                        'search_type': 'Google News'
-                    }
-                    articles.append(article_info)
-                    print(f"  📰 {article_info['title']} - {article_info['source']}")
+                articles = [_serpapi_article(item) for item in news_results]
+                for article in articles:
+                    logger.info("  📰 %s - %s", article.title, article.source)
             else:
-                print(f"⚠ No news articles found for '{person_name}'")
+                logger.warning("⚠ No news articles found for '%s'", person_name)
                 
         except Exception as e:
-            print(f"❌ Error searching Google News: {e}")
-            print("ℹ Falling back to basic search...")
-            return self._search_google_news_basic(person_name, max_results)
+            logger.error("❌ Error searching Google News: %s", e)
+            logger.info("ℹ Falling back to basic search...")
+            return self._search_google_news_basic(person_name, max_results) or None
         
         return articles
     
-    def _search_google_news_basic(self, person_name: str, max_results: int = 10) -> List[Dict]:
+    def _search_google_news_basic(self, person_name: str, max_results: int = 10) -> Optional[List[NewsArticle]]:
         """
         Basic Google News search without API (web scraping).
         Note: This is less reliable and may be blocked by Google.
+        Returns None if the search failed.
         """
         articles = []
         try:
-            print(f"🔍 Performing basic Google News search for {person_name}...")
+            logger.info("🔍 Performing basic Google News search for %s...", person_name)
             
             # Google News search URL
             query = person_name.replace(' ', '+')
             url = f"https://www.google.com/search?q={query}&tbm=nws"
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._session.get(url, timeout=self.timeout)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                tree = LexborHTMLParser(response.text)
                 
                 # Find news result divs (structure may change)
-                news_items = soup.find_all('div', class_='SoaBEf')[:max_results]
+                news_items = tree.css('div.SoaBEf')[:max_results]
                 
                 if news_items:
-                    print(f"✓ Found {len(news_items)} news articles")
+                    logger.info("✓ Found %d news articles", len(news_items))
                     
                     for item in news_items:
                         try:
-                            title_elem = item.find('div', role='heading')
-                            title = title_elem.text if title_elem else 'N/A'
+                            title_elem = item.css_first('div[role="heading"]')
+                            title = title_elem.text() if title_elem else 'N/A'
                             
-                            link_elem = item.find('a')
-                            link = link_elem.get('href', 'N/A') if link_elem else 'N/A'
+                            link_elem = item.css_first('a')
+                            link = (link_elem.attributes.get('href') or 'N/A') if link_elem else 'N/A'
                             
-                            source_elem = item.find('div', class_='MgUUmf')
-                            source = source_elem.text if source_elem else 'N/A'
+                            source_elem = item.css_first('div.MgUUmf')
+                            source = source_elem.text() if source_elem else 'N/A'
                             
-                            snippet_elem = item.find('div', class_='GI74Re')
-                            snippet = snippet_elem.text if snippet_elem else 'N/A'
+                            snippet_elem = item.css_first('div.GI74Re')
+                            snippet = snippet_elem.text() if snippet_elem else 'N/A'
                             
-                            article_info = {
-                                'title': title,
-                                'source': source,
-                                'date': 'N/A',
-                                'snippet': snippet,
-                                'url': link,
-                                'thumbnail': 'N/A',
-                                'search_type': 'Google News (Basic)'
-                            }
-                            articles.append(article_info)
-                            print(f"  📰 {title}")
+                            articles.append(NewsArticle(
+                                title=title,
+                                source=source,
+                                date='N/A',
+                                snippet=snippet,
+                                url=link,
+                                thumbnail='N/A',
+                                search_type='Google News (Basic)'
+                            ))
+                            logger.info("  📰 %s", title)
                         except Exception as e:
                             continue
                 else:
-                    print(f"⚠ No news articles found (basic search)")
+                    logger.warning("⚠ No news articles found (basic search)")
             else:
-                print(f"❌ Error: HTTP {response.status_code}")
+                logger.error("❌ Error: HTTP %s", response.status_code)
+                return None
                 
         except Exception as e:
-            print(f"❌ Error in basic Google News search: {e}")
+            logger.error("❌ Error in basic Google News search: %s", e)
+            return None
         
         return articles
     
-    def search_university_news(self, person_name: str, university: str = None) -> List[Dict]:
+    def search_university_news(self, person_name: str, university: str = None) -> List[NewsArticle]:
         """
         Search university news sites for mentions.
         
@@ -152,81 +294,148 @@ class NewsSearcher:
             university: University name (e.g., "Columbia", "MIT")
             
         Returns:
-            List of dictionaries containing article information
+            List of NewsArticle records
         """
-        articles = []
+        return asyncio.run(self._search_university_news_async(person_name, university)) or []
+    
+    async def _search_university_news_async(self, person_name: str,
+                                            university: str = None) -> Optional[List[NewsArticle]]:
+        """
+        Async implementation of search_university_news.
         
-        # University news site search URLs
-        university_sites = {
-            'columbia': 'https://news.columbia.edu/?s=',
-            'mit': 'https://news.mit.edu/search/',
-            'stanford': 'https://news.stanford.edu/search/',
-            'harvard': 'https://news.harvard.edu/gazette/?s='
-        }
+        Returns None if every site that was queried failed.
+        """
+        articles = []
         
         if university:
-            sites = {university.lower(): university_sites.get(university.lower())}
+            sites = {university.lower(): _UNIVERSITY_SITES.get(university.lower())}
             if not sites[university.lower()]:
-                print(f"⚠ University '{university}' not in predefined list. Using generic search.")
+                logger.warning("⚠ University '%s' not in predefined list. Using generic search.", university)
                 return articles
         else:
-            sites = university_sites
+            sites = _UNIVERSITY_SITES
+        
+        name_key = _name_key(person_name)
+        skipped = [
+            uni_name for uni_name in sites if recently_empty(('uni', uni_name, name_key), self.cache_dir)
+        ]
+        if skipped:
+            logger.info("ℹ Skipping %s news for %s (no results on a recent search)",
+                        ', '.join(uni_name.upper() for uni_name in skipped), person_name)
+        sites = {
+            uni_name: base_url for uni_name, base_url in sites.items()
+            if base_url and uni_name not in skipped
+        }
+        if not sites:
+            return articles
+        
+        # Every site is a different host, so there is nothing to be polite
+        # about between them; fetch them all at once on one event loop.
+        query = quote_plus(person_name)
+        name_pattern = _name_prefilter(person_name)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit=16)
+        async with aiohttp.ClientSession(connector=connector,
+                                         headers=_UNI_HEADERS,
+                                         timeout=client_timeout(self.timeout)) as session:
+            batches = await asyncio.gather(*[
+                self._fetch_one_uni(session, semaphore, uni_name, base_url, person_name,
+                                    query, name_pattern)
+                for uni_name, base_url in sites.items()
+            ])
         
-        for uni_name, base_url in sites.items():
-            if not base_url:
+        if all(batch is None for batch in batches):
+            return None
+        
+        for uni_name, batch in zip(sites, batches):
+            if batch is None:
                 continue
-                
-            try:
-                print(f"🔍 Searching {uni_name.upper()} news for {person_name}...")
-                
-                query = person_name.replace(' ', '+')
-                url = base_url + query
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                
-                response = requests.get(url, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+            if not batch:
+                remember_empty(('uni', uni_name, name_key), self.neg_cache_ttl, self.cache_dir)
+            articles.extend(batch)
+        
+        return articles
+    
+    async def _fetch_one_uni(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                             uni_name: str, base_url: str, person_name: str,
+                             query: str,
+                             name_pattern: Optional[re.Pattern] = None) -> Optional[List[NewsArticle]]:
+        """
+        Search a single university news site for mentions.
+        
+        Args:
+            session: Shared aiohttp session
+            semaphore: Semaphore bounding concurrent requests
+            uni_name: Short university key (e.g., "columbia")
+            base_url: Search URL prefix for the university news site
+            person_name: Full name of the person to search for
+            query: URL-encoded search query for the person
+            name_pattern: Optional bytes pattern for the name; pages that do
+                not match it are skipped without parsing
+            
+        Returns:
+            List of NewsArticle records, or None if the site could not be searched
+        """
+        articles = []
+        try:
+            logger.info("🔍 Searching %s news for %s...", uni_name.upper(), person_name)
+            
+            url = f"{base_url}{query}"
+            
+            async with semaphore:
+                status, body, encoding = await fetch(session, url)
+            
+            if status == 200:
+                # A page that never mentions the name cannot contain a matching
+                # link, so a byte scan lets us skip parsing it entirely
+                if name_pattern is None or name_pattern.search(body):
+                    tree = LexborHTMLParser(body.decode(encoding, errors='replace'))
                     
                     # Generic search for article links
-                    links = soup.find_all('a', href=True)
+                    links = tree.css('a[href]')
+                    name_lower = person_name.casefold()
                     
-                    found_count = 0
                     for link in links[:20]:  # Check first 20 links
-                        href = link.get('href', '')
-                        text = link.text.strip()
+                        href = link.attributes.get('href') or ''
+                        if _BOILERPLATE_HREF_RE.search(href):
+                            continue
+                        
+                        text = link.text().strip()
                         
                         # Filter for likely article links
-                        if text and len(text) > 20 and person_name.lower() in text.lower():
-                            article_info = {
-                                'title': text,
-                                'source': f"{uni_name.upper()} News",
-                                'date': 'N/A',
-                                'snippet': text[:200],
-                                'url': href if href.startswith('http') else base_url.split('?')[0].rstrip('/') + href,
-                                'thumbnail': 'N/A',
-                                'search_type': 'University News'
-                            }
-                            articles.append(article_info)
-                            found_count += 1
-                            print(f"  📰 {text[:80]}...")
-                    
-                    if found_count == 0:
-                        print(f"  ⚠ No articles found on {uni_name.upper()} news")
-                else:
-                    print(f"  ❌ Error: HTTP {response.status_code}")
+                        if len(text) > 20 and name_lower in text.casefold():
+                            try:
+                                article_url = urljoin(url, href)
+                            except ValueError:
+                                # One malformed anchor (e.g. "http://[broken")
+                                # must not fail the whole site
+                                continue
+                            
+                            articles.append(NewsArticle(
+                                title=text,
+                                source=f"{uni_name.upper()} News",
+                                date='N/A',
+                                snippet=text[:200],
+                                url=article_url,
+                                thumbnail='N/A',
+                                search_type='University News'
+                            ))
+                            logger.info("  📰 %s...", text[:80])
                     
-                time.sleep(1)  # Be polite to servers
+                if not articles:
+                    logger.warning("  ⚠ No articles found on %s news", uni_name.upper())
+            else:
+                logger.error("  ❌ Error: HTTP %s", status)
+                return None
                 
-            except Exception as e:
-                print(f"  ❌ Error searching {uni_name.upper()} news: {e}")
+        except Exception as e:
+            logger.error("  ❌ Error searching %s news: %s", uni_name.upper(), e)
+            return None
         
         return articles
     
-    def search_all(self, person_name: str, university: str = None, max_results: int = 10) -> Dict[str, List[Dict]]:
+    def search_all(self, person_name: str, university: str = None, max_results: int = 10,
+                   keep_failures: bool = False) -> Dict[str, List[NewsArticle]]:
         """
         Search all news sources for a person.
         
@@ -234,15 +443,33 @@ class NewsSearcher:
             person_name: Full name of the person to search for
             university: Optional university name for targeted search
             max_results: Maximum number of results per source
+            keep_failures: Report a source that failed as None instead of an
+                empty list
             
         Returns:
             Dictionary with results from each source
         """
+        return asyncio.run(self._search_all_async(person_name, university, max_results, keep_failures))
+    
+    async def _search_all_async(self, person_name: str, university: str = None,
+                                max_results: int = 10,
+                                keep_failures: bool = False) -> Dict[str, List[NewsArticle]]:
+        """Async implementation of search_all."""
+        # Google News goes through SerpAPI or the blocking session, so it runs
+        # in a worker thread alongside the university fetches.
+        google_news, university_news = await asyncio.gather(
+            asyncio.to_thread(self._google_news, person_name, max_results),
+            self._search_university_news_async(person_name, university)
+        )
+        
         results = {
-            'google_news': self.search_google_news(person_name, max_results),
-            'university_news': self.search_university_news(person_name, university)
+            'google_news': google_news,
+            'university_news': university_news
         }
         
+        if not keep_failures:
+            results = {source: articles or [] for source, articles in results.items()}
+        
         return results
 
 
@@ -252,21 +479,24 @@ if __name__ == "__main__":
     from dotenv import load_dotenv
     
     load_dotenv()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     
     serpapi_key = os.getenv('SERPAPI_KEY')
     searcher = NewsSearcher(serpapi_key=serpapi_key)
-    
-    results = searcher.search_all("Aruzhan Abil", university="Columbia", max_results=5)
-    
-    print("\n" + "="*80)
-    print("NEWS SEARCH RESULTS")
-    print("="*80)
-    
-    for source, articles in results.items():
-        print(f"\n{source.upper().replace('_', ' ')}: {len(articles)} articles found")
-        print("-"*80)
-        for i, article in enumerate(articles, 1):
-            print(f"\n{i}. {article['title']}")
-            print(f"   Source: {article['source']}")
-            print(f"   URL: {article['url']}")
+    try:
+        results = searcher.search_all("Aruzhan Abil", university="Columbia", max_results=5)
+        
+        print("\n" + "="*80)
+        print("NEWS SEARCH RESULTS")
+        print("="*80)
+        
+        for source, articles in results.items():
+            print(f"\n{source.upper().replace('_', ' ')}: {len(articles)} articles found")
+            print("-"*80)
+            for i, article in enumerate(articles, 1):
+                print(f"\n{i}. {article['title']}")
+                print(f"   Source: {article['source']}")
+                print(f"   URL: {article['url']}")
+    finally:
+        searcher.close()
 
@@ -1,33 +1,231 @@
 """
 Module for searching academic papers across multiple sources.
 """
-import requests
-from bs4 import BeautifulSoup
-from scholarly import scholarly
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from io import BytesIO
+import aiohttp
+from lxml import etree
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import random
 import time
-from typing import List, Dict
+from dataclasses import dataclass
+from typing import BinaryIO, List, Dict, Optional, Tuple, Union
+from urllib.parse import quote
+
+from async_http import client_timeout, fetch
+from http_session import pooled_session
+from records import RecordMixin
+from search_cache import DEFAULT_CACHE_DIR, disk_memoize, name_key, single_flight
+
+
+logger = logging.getLogger(__name__)
+
+_WS = re.compile(r'\s+')
+
+_ATOM_NS = {'a': 'http://www.w3.org/2005/Atom'}
+_ATOM_ENTRY = '{http://www.w3.org/2005/Atom}entry'
+
+# arXiv asks API clients to identify themselves rather than pose as a browser
+ARXIV_USER_AGENT = 'person-search-tool/1.0'
+
+# Kept small: Google Scholar blocks clients that fetch too aggressively
+SCHOLAR_FILL_WORKERS = 5
+
+# arXiv feeds at least this large are parsed in a worker process; smaller
+# ones parse faster in a thread than the pickling round-trip would take
+PARSE_IN_PROCESS_MIN_BYTES = 256 * 1024
+PARSE_POOL_WORKERS = min(4, os.cpu_count() or 1)
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+# Bib fields read from a publication; author-profile stubs lack the last two
+_SCHOLAR_BIB_FIELDS = ('title', 'author', 'abstract')
+
+
+@dataclass(slots=True)
+class Paper(RecordMixin):
+    """A single paper found on Google Scholar or arXiv."""
+    title: str
+    authors: str
+    year: str
+    venue: str
+    citations: Union[int, str]
+    url: str
+    abstract: str
+    source: str
+
+
+def _clean(text: Optional[str]) -> str:
+    """Collapse whitespace runs (including line breaks) into single spaces."""
+    return _WS.sub(' ', text).strip() if text else ''
+
+
+def _needs_fill(pub: Dict) -> bool:
+    """Whether a publication stub is missing bib fields we report."""
+    bib = pub.get('bib', {})
+    return not pub.get('filled') and not all(key in bib for key in _SCHOLAR_BIB_FIELDS)
+
+
+def _pub_matches(pub: Dict, min_year: Optional[int], min_citations: int) -> bool:
+    """Whether a publication stub passes the year and citation filters."""
+    if pub.get('num_citations', 0) < min_citations:
+        return False
+    if min_year is not None:
+        try:
+            return int(pub.get('bib', {}).get('pub_year')) >= min_year
+        except (TypeError, ValueError):
+            return False
+    return True
+
+
+def _safe_fill(pub: Dict) -> Optional[Dict]:
+    """Fill a Google Scholar publication stub, returning None if it fails."""
+    if not _needs_fill(pub):
+        return pub
+    
+    from scholarly import scholarly
+    
+    # Jitter so parallel workers don't hit Scholar in lockstep
+    time.sleep(random.uniform(0.1, 0.3))
+    try:
+        return scholarly.fill(pub)
+    except Exception as e:
+        logger.warning("  ⚠ Error fetching publication details: %s", e)
+        return None
+
+
+def _parse_arxiv_feed(content: Union[bytes, BinaryIO]) -> List[Paper]:
+    """
+    Parse an arXiv Atom feed into Paper records.
+    
+    Top-level (and free of searcher state) so it can run in a worker process.
+    
+    Args:
+        content: Raw Atom XML returned by the arXiv API, or a stream of it
+    
+    Returns:
+        List of Paper records
+    """
+    papers = []
+    if isinstance(content, bytes):
+        content = BytesIO(content)
+    
+    for _, entry in etree.iterparse(content, tag=_ATOM_ENTRY, remove_blank_text=True):
+        title = _clean(entry.findtext('a:title', '', _ATOM_NS))
+        authors = [author.findtext('a:name', '', _ATOM_NS) for author in entry.iterfind('a:author', _ATOM_NS)]
+        published = entry.findtext('a:published', '', _ATOM_NS)[:4]  # Get year
+        summary = _clean(entry.findtext('a:summary', '', _ATOM_NS))
+        link = entry.findtext('a:id', '', _ATOM_NS)
+        # Entries are only read once, so free them as the parse advances
+        entry.clear(keep_tail=True)
+    
+        paper_info = Paper(
+            title=title,
+            authors=', '.join(authors),
+            year=published,
+            venue='arXiv',
+            citations='N/A',
+            url=link,
+            abstract=summary,
+            source='arXiv'
+        )
+        papers.append(paper_info)
+    
+    return papers
+
+
+def _papers_by_author(papers: List[Paper], person_names: List[str],
+                      max_results_per_person: int) -> Dict[str, List[Paper]]:
+    """
+    Assign papers from a batched arXiv feed to the people who wrote them.
+    
+    A paper goes to a person only when one of its authors has exactly that
+    name, ignoring case and spacing, and each person gets at most
+    `max_results_per_person` papers, in feed order.
+    """
+    results = {name: [] for name in person_names}
+    keys = {name_key(name): name for name in person_names}
+    for paper in papers:
+        for author in paper.authors.split(', '):
+            name = keys.get(name_key(author))
+            if name is not None and len(results[name]) < max_results_per_person:
+                results[name].append(paper)
+    return results
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the process pool used for large arXiv feeds, creating it on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # Spawned, not forked: the searchers run several threads by now,
+            # and forking a multi-threaded process can deadlock the child
+            _parse_pool = ProcessPoolExecutor(max_workers=PARSE_POOL_WORKERS,
+                                              mp_context=multiprocessing.get_context('spawn'))
+        return _parse_pool
 
 
 class PaperSearcher:
     """Search for academic papers using Google Scholar and arXiv."""
     
-    def __init__(self):
+    def __init__(self, timeout: Union[float, Tuple[float, float]] = 10.0,
+                 cache_dir: str = DEFAULT_CACHE_DIR):
         self.results = []
+        self.timeout = timeout
+        # Where memoized arXiv and Scholar results are kept
+        self.cache_dir = cache_dir
+        
+        # arXiv API endpoint, over HTTPS to skip the http:// redirect
+        self._arxiv_url_tpl = 'https://export.arxiv.org/api/query?search_query={query}&start=0&max_results={n}'
+        
+        # Keep-alive connection pool shared by every arXiv request
+        # requests already asks for gzip/deflate, and br once brotli is installed
+        self._session = pooled_session(ARXIV_USER_AGENT)
+        # A redirect would silently double latency; fail loudly instead
+        self._session.max_redirects = 0
     
-    def search_google_scholar(self, person_name: str, max_results: int = 10) -> List[Dict]:
+    def close(self):
+        """Close pooled HTTP connections."""
+        self._session.close()
+    
+    def search_google_scholar(self, person_name: str, max_results: int = 10,
+                              min_year: Optional[int] = None, min_citations: int = 0) -> List[Paper]:
         """
         Search Google Scholar for papers by a person.
         
         Args:
             person_name: Full name of the person to search for
             max_results: Maximum number of results to return
+            min_year: Skip papers published before this year (and undated ones)
+            min_citations: Skip papers with fewer citations than this
             
         Returns:
-            List of dictionaries containing paper information
+            List of Paper records
+        """
+        return self._search_google_scholar(person_name, max_results, min_year, min_citations) or []
+    
+    @disk_memoize(ttl=3600, negative_ttl=86400)
+    def _search_google_scholar(self, person_name: str, max_results: int = 10,
+                               min_year: Optional[int] = None,
+                               min_citations: int = 0) -> Optional[List[Paper]]:
+        """
+        Search Google Scholar. Returns None if the search failed.
         """
         papers = []
         try:
-            print(f"🔍 Searching Google Scholar for papers by {person_name}...")
+            # Imported on first use: scholarly is slow to load and arXiv-only
+            # callers never need it
+            from scholarly import scholarly
+            
+            logger.info("🔍 Searching Google Scholar for papers by %s...", person_name)
             
             # Search for the author
             search_query = scholarly.search_author(person_name)
@@ -35,43 +233,64 @@ class PaperSearcher:
             # Get the first author match
             try:
                 author = next(search_query)
-                author = scholarly.fill(author)
+                # The search stub already has name, affiliation and citedby;
+                # skip the coauthor/citation-history scrapes we never read
+                filtering = min_year is not None or min_citations > 0
+                author = scholarly.fill(author, sections=['publications'],
+                                        publication_limit=0 if filtering else max_results)
                 
-                print(f"✓ Found author: {author.get('name', 'Unknown')}")
-                print(f"  Affiliation: {author.get('affiliation', 'N/A')}")
-                print(f"  Total citations: {author.get('citedby', 0)}")
+                logger.info("✓ Found author: %s", author.get('name', 'Unknown'))
+                logger.info("  Affiliation: %s", author.get('affiliation', 'N/A'))
+                logger.info("  Total citations: %s", author.get('citedby', 0))
                 
-                # Get publications
-                publications = author.get('publications', [])[:max_results]
+                # Filter on the stubs, which already carry year and citation
+                # count, so only papers we keep cost a fill request
+                candidates = (
+                    pub for pub in author.get('publications', [])
+                    if _pub_matches(pub, min_year, min_citations)
+                )
+                publications = list(itertools.islice(candidates, max_results))
                 
-                for pub in publications:
-                    try:
-                        pub_filled = scholarly.fill(pub)
-                        paper_info = {
-                            'title': pub_filled.get('bib', {}).get('title', 'N/A'),
-                            'authors': pub_filled.get('bib', {}).get('author', 'N/A'),
-                            'year': pub_filled.get('bib', {}).get('pub_year', 'N/A'),
-                            'venue': pub_filled.get('bib', {}).get('venue', 'N/A'),
-                            'citations': pub_filled.get('num_citations', 0),
-                            'url': pub_filled.get('pub_url', pub_filled.get('eprint_url', 'N/A')),
-                            'abstract': pub_filled.get('bib', {}).get('abstract', 'N/A'),
-                            'source': 'Google Scholar'
-                        }
-                        papers.append(paper_info)
-                        print(f"  📄 {paper_info['title']} ({paper_info['year']})")
-                    except Exception as e:
-                        print(f"  ⚠ Error fetching publication details: {e}")
+                # Each fill is a separate blocking request; overlap them
+                with ThreadPoolExecutor(max_workers=SCHOLAR_FILL_WORKERS) as executor:
+                    filled = list(executor.map(_safe_fill, publications))
+                
+                # Scholar blocking every fill (CAPTCHA, 429) is a failure, not
+                # an author without papers, so it must not be cached as empty
+                if publications and all(pub_filled is None for pub_filled in filled):
+                    logger.error("❌ Could not fetch any publication details from Google Scholar")
+                    return None
+                
+                for pub_filled in filled:
+                    if pub_filled is None:
                         continue
+                    
+                    paper_info = Paper(
+                        title=_clean(pub_filled.get('bib', {}).get('title')) or 'N/A',
+                        authors=pub_filled.get('bib', {}).get('author', 'N/A'),
+                        year=pub_filled.get('bib', {}).get('pub_year', 'N/A'),
+                        venue=pub_filled.get('bib', {}).get('venue', 'N/A'),
+                        citations=pub_filled.get('num_citations', 0),
+                        url=pub_filled.get('pub_url', pub_filled.get('eprint_url', 'N/A')),
+                        abstract=_clean(pub_filled.get('bib', {}).get('abstract')) or 'N/A',
+                        source='Google Scholar'
+                    )
+                    papers.append(paper_info)
+                    logger.info("  📄 %s (%s)", paper_info.title, paper_info.year)
                         
             except StopIteration:
-                print(f"⚠ No author found for '{person_name}' on Google Scholar")
+                logger.warning("⚠ No author found for '%s' on Google Scholar", person_name)
                 
+        except ImportError:
+            logger.error("❌ scholarly library not installed. Run: pip install scholarly")
+            return None
         except Exception as e:
-            print(f"❌ Error searching Google Scholar: {e}")
+            logger.error("❌ Error searching Google Scholar: %s", e)
+            return None
         
         return papers
     
-    def search_arxiv(self, person_name: str, max_results: int = 10) -> List[Dict]:
+    def search_arxiv(self, person_name: str, max_results: int = 10) -> List[Paper]:
         """
         Search arXiv for papers by a person.
         
@@ -80,92 +299,257 @@ class PaperSearcher:
             max_results: Maximum number of results to return
             
         Returns:
-            List of dictionaries containing paper information
+            List of Paper records
+        """
+        return self._search_arxiv(person_name, max_results) or []
+    
+    @single_flight(lambda self, person_name, max_results=10: (name_key(person_name), max_results))
+    @disk_memoize(ttl=3600, name='PaperSearcher._search_arxiv', negative_ttl=86400)
+    def _search_arxiv(self, person_name: str, max_results: int = 10) -> Optional[List[Paper]]:
+        """
+        Search arXiv, streaming the feed. Returns None if the search failed.
         """
-        papers = []
         try:
-            print(f"🔍 Searching arXiv for papers by {person_name}...")
+            logger.info("🔍 Searching arXiv for papers by %s...", person_name)
             
-            # arXiv API endpoint
-            base_url = 'http://export.arxiv.org/api/query?'
+            # Stream the feed into the parser rather than buffering it whole
+            with self._session.get(self._arxiv_url([person_name], max_results),
+                                   timeout=self.timeout, stream=True) as response:
+                if response.status_code == 200:
+                    response.raw.decode_content = True
+                    return self._parse_arxiv(response.raw, person_name)
+                logger.error("❌ Error: arXiv API returned status code %s", response.status_code)
+                
+        except Exception as e:
+            logger.error("❌ Error searching arXiv: %s", e)
+        
+        return None
+    
+    async def search_arxiv_async(self, session: aiohttp.ClientSession, person_name: str,
+                                 max_results: int = 10) -> List[Paper]:
+        """
+        Search arXiv for papers by a person without blocking the event loop.
+        
+        Args:
+            session: aiohttp session to issue the request on
+            person_name: Full name of the person to search for
+            max_results: Maximum number of results to return
             
-            # Format the search query
-            query = f'search_query=au:"{person_name}"&start=0&max_results={max_results}'
-            url = base_url + query
+        Returns:
+            List of Paper records
+        """
+        return await self._search_arxiv_async(session, person_name, max_results) or []
+    
+    @single_flight(lambda self, session, person_name, max_results=10: (name_key(person_name), max_results))
+    # Shares entries with _search_arxiv; the per-call session is not part of the key
+    @disk_memoize(ttl=3600, name='PaperSearcher._search_arxiv', ignore=('session',), negative_ttl=86400)
+    async def _search_arxiv_async(self, session: aiohttp.ClientSession, person_name: str,
+                                  max_results: int = 10) -> Optional[List[Paper]]:
+        """
+        Async counterpart of _search_arxiv. Returns None if the search failed.
+        """
+        try:
+            logger.info("🔍 Searching arXiv for papers by %s...", person_name)
             
-            response = requests.get(url, timeout=10)
+            # Like the sync session's max_redirects = 0: the HTTPS URL is final, so a
+            # redirect is reported as an error below rather than followed
+            status, body, _ = await fetch(session, self._arxiv_url([person_name], max_results),
+                                          allow_redirects=False)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'xml')
-                entries = soup.find_all('entry')
+            if status == 200:
+                # Parsing is CPU-bound; keep it off the event loop
+                papers = await self._parse_arxiv_async(body)
+                self._report_arxiv(papers, person_name)
+                return papers
+            logger.error("❌ Error: arXiv API returned status code %s", status)
                 
-                if entries:
-                    print(f"✓ Found {len(entries)} papers on arXiv")
-                    
-                    for entry in entries:
-                        title = entry.find('title').text.strip().replace('\n', ' ')
-                        authors = [author.find('name').text for author in entry.find_all('author')]
-                        published = entry.find('published').text[:4]  # Get year
-                        summary = entry.find('summary').text.strip().replace('\n', ' ')
-                        link = entry.find('id').text
-                        
-                        paper_info = {
-                            'title': title,
-                            'authors': ', '.join(authors),
-                            'year': published,
-                            'venue': 'arXiv',
-                            'citations': 'N/A',
-                            'url': link,
-                            'abstract': summary,
-                            'source': 'arXiv'
-                        }
-                        papers.append(paper_info)
-                        print(f"  📄 {title} ({published})")
+        except Exception as e:
+            logger.error("❌ Error searching arXiv: %s", e)
+        
+        return None
+    
+    def search_arxiv_batch(self, person_names: List[str],
+                           max_results_per_person: int = 10) -> Dict[str, List[Paper]]:
+        """
+        Search arXiv for papers by several people in a single API call.
+        
+        Papers are assigned to a person only when one of their authors has
+        exactly that name (ignoring case and spacing), so "Wei Li" does not
+        pick up papers by "Wei Lin". The shared feed is capped at
+        `max_results_per_person * len(person_names)` entries; if it comes back
+        full, one prolific author may have crowded the others out, so anyone
+        left with fewer than `max_results_per_person` papers is searched for
+        on their own.
+        
+        Args:
+            person_names: Full names of the people to search for
+            max_results_per_person: Maximum number of results to return per person
+            
+        Returns:
+            Dictionary mapping each name to its list of Paper records
+        """
+        if len(person_names) == 1:
+            return {person_names[0]: self.search_arxiv(person_names[0], max_results_per_person)}
+        
+        results = {name: [] for name in person_names}
+        try:
+            logger.info("🔍 Searching arXiv for papers by %s...", ', '.join(person_names))
+            
+            limit = max_results_per_person * len(person_names)
+            url = self._arxiv_url(person_names, limit)
+            with self._session.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code == 200:
+                    response.raw.decode_content = True
+                    papers = self._parse_arxiv(response.raw, ', '.join(person_names))
                 else:
-                    print(f"⚠ No papers found for '{person_name}' on arXiv")
-            else:
-                print(f"❌ Error: arXiv API returned status code {response.status_code}")
+                    logger.error("❌ Error: arXiv API returned status code %s", response.status_code)
+                    papers = []
+            
+            results = _papers_by_author(papers, person_names, max_results_per_person)
+            
+            if len(papers) >= limit:
+                for name in person_names:
+                    if len(results[name]) < max_results_per_person:
+                        logger.info("ℹ arXiv batch was truncated, searching for %s separately", name)
+                        results[name] = self.search_arxiv(name, max_results_per_person)
                 
         except Exception as e:
-            print(f"❌ Error searching arXiv: {e}")
+            logger.error("❌ Error searching arXiv: %s", e)
+        
+        return results
+    
+    def _arxiv_url(self, person_names: List[str], max_results: int) -> str:
+        """Build the arXiv API query URL for an author search."""
+        # Several authors are OR-ed together
+        authors = ' OR '.join(f'au:"{name}"' for name in person_names)
+        return self._arxiv_url_tpl.format(query=quote(authors), n=max_results)
+    
+    def _parse_arxiv(self, content: Union[bytes, BinaryIO], person_name: str) -> List[Paper]:
+        """
+        Parse an arXiv Atom feed into Paper records.
         
+        Args:
+            content: Raw Atom XML returned by the arXiv API, or a stream of it
+            person_name: Name that was searched for (used in messages)
+            
+        Returns:
+            List of Paper records
+        """
+        papers = _parse_arxiv_feed(content)
+        self._report_arxiv(papers, person_name)
         return papers
     
-    def search_all(self, person_name: str, max_results: int = 10) -> Dict[str, List[Dict]]:
+    async def _parse_arxiv_async(self, body: bytes) -> List[Paper]:
+        """Parse an arXiv feed off the event loop, in a worker process if it is large."""
+        if len(body) >= PARSE_IN_PROCESS_MIN_BYTES:
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(_get_parse_pool(), _parse_arxiv_feed, body)
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning("⚠ arXiv parse worker unavailable, parsing in a thread: %s", e)
+        return await asyncio.to_thread(_parse_arxiv_feed, body)
+    
+    def _report_arxiv(self, papers: List[Paper], person_name: str):
+        """Log the outcome of an arXiv search."""
+        if papers:
+            logger.info("✓ Found %d papers on arXiv", len(papers))
+            for paper in papers:
+                logger.info("  📄 %s (%s)", paper.title, paper.year)
+        else:
+            logger.warning("⚠ No papers found for '%s' on arXiv", person_name)
+    
+    def search_all(self, person_name: Union[str, List[str]],
+                   max_results: int = 10, keep_failures: bool = False) -> Dict[str, List[Paper]]:
         """
         Search all paper sources for a person.
         
+        Args:
+            person_name: Full name of the person to search for, or a list of names
+            max_results: Maximum number of results per source
+            keep_failures: Report a source that failed as None instead of an
+                empty list (single-name searches only)
+            
+        Returns:
+            Dictionary with results from each source; for a list of names, a
+            dictionary mapping each name to its results
+        """
+        if isinstance(person_name, str):
+            return asyncio.run(self.search_all_async(person_name, max_results, keep_failures))
+        return asyncio.run(self._search_all_batch_async(person_name, max_results))
+    
+    async def search_all_async(self, person_name: str, max_results: int = 10,
+                               keep_failures: bool = False) -> Dict[str, List[Paper]]:
+        """
+        Search all paper sources for a person concurrently.
+        
         Args:
             person_name: Full name of the person to search for
             max_results: Maximum number of results per source
+            keep_failures: Report a source that failed as None instead of an
+                empty list
             
         Returns:
             Dictionary with results from each source
         """
+        async with aiohttp.ClientSession(timeout=client_timeout(self.timeout),
+                                         headers={'User-Agent': ARXIV_USER_AGENT}) as session:
+            # scholarly is a blocking client, so it runs in a worker thread
+            google_scholar, arxiv = await asyncio.gather(
+                asyncio.to_thread(self._search_google_scholar, person_name, max_results),
+                self._search_arxiv_async(session, person_name, max_results)
+            )
+        
         results = {
-            'google_scholar': self.search_google_scholar(person_name, max_results),
-            'arxiv': self.search_arxiv(person_name, max_results)
+            'google_scholar': google_scholar,
+            'arxiv': arxiv
         }
         
+        if not keep_failures:
+            results = {source: papers or [] for source, papers in results.items()}
+        
         return results
+    
+    async def _search_all_batch_async(self, person_names: List[str],
+                                      max_results: int = 10) -> Dict[str, Dict[str, List[Paper]]]:
+        """Search all paper sources for several people, batching the arXiv query."""
+        if len(person_names) == 1:
+            return {person_names[0]: await self.search_all_async(person_names[0], max_results)}
+        
+        def scholar_all() -> List[List[Paper]]:
+            # One name at a time: parallel lookups get Scholar to block us sooner
+            return [self.search_google_scholar(name, max_results) for name in person_names]
+        
+        google_scholar, arxiv = await asyncio.gather(
+            asyncio.to_thread(scholar_all),
+            asyncio.to_thread(self.search_arxiv_batch, person_names, max_results)
+        )
+        
+        return {
+            name: {'google_scholar': papers, 'arxiv': arxiv[name]}
+            for name, papers in zip(person_names, google_scholar)
+        }
 
 
 if __name__ == "__main__":
     # Example usage
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     searcher = PaperSearcher()
-    results = searcher.search_all("Aruzhan Abil", max_results=5)
-    
-    print("\n" + "="*80)
-    print("SEARCH RESULTS")
-    print("="*80)
-    
-    for source, papers in results.items():
-        print(f"\n{source.upper().replace('_', ' ')}: {len(papers)} papers found")
-        print("-"*80)
-        for i, paper in enumerate(papers, 1):
-            print(f"\n{i}. {paper['title']}")
-            print(f"   Authors: {paper['authors']}")
-            print(f"   Year: {paper['year']}")
-            print(f"   Venue: {paper['venue']}")
-            print(f"   URL: {paper['url']}")
-
+    try:
+        results = searcher.search_all("Aruzhan Abil", max_results=5)
+        
+        print("\n" + "="*80)
+        print("SEARCH RESULTS")
+        print("="*80)
+        
+        for source, papers in results.items():
+            print(f"\n{source.upper().replace('_', ' ')}: {len(papers)} papers found")
+            print("-"*80)
+            for i, paper in enumerate(papers, 1):
+                print(f"\n{i}. {paper['title']}")
+                print(f"   Authors: {paper['authors']}")
+                print(f"   Year: {paper['year']}")
+                print(f"   Venue: {paper['venue']}")
+                print(f"   URL: {paper['url']}")
+    finally:
+        searcher.close()
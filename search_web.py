@@ -1,90 +1,227 @@
 """
 Module for general web searches using Tavily API.
 """
+import asyncio
+import logging
+import threading
+import orjson
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
-import time
+from dataclasses import dataclass
+from selectolax.lexbor import LexborHTMLParser
+from typing import List, Dict, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+from http_session import pooled_session
+from rate_limiter import RateLimiter, TAVILY_RATE_LIMITER
+from records import RecordMixin
+from search_cache import DEFAULT_CACHE_DIR, disk_memoize, name_key, single_flight
+
+
+logger = logging.getLogger(__name__)
+
+# Paces the keyless Google scrape fallback, which has no documented quota
+SCRAPE_RATE_LIMITER = RateLimiter(max_calls=2, period=1)
+
+# Extra Tavily keywords per search_all bucket; also used to classify results
+_BUCKET_KEYWORDS = {
+    'academic': "research OR paper OR publication OR scholar OR university",
+    'podcasts_interviews': "podcast OR interview OR talk OR guest OR speaker"
+}
+
+
+@dataclass(slots=True)
+class WebResult(RecordMixin):
+    """A single web search result."""
+    title: str
+    url: str
+    snippet: str
+    score: float
+    source: str
+
+
+def _orjson_hook(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """Decode a response's JSON body with orjson instead of the stdlib parser."""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def _tavily_client(api_key: str):
+    """Create a TavilyClient whose responses are decoded with orjson."""
+    from tavily import TavilyClient
+    
+    client = TavilyClient(api_key=api_key)
+    # TavilyClient calls response.json() on its own requests.Session
+    session = getattr(client, 'session', None)
+    if session is not None:
+        session.hooks['response'].append(_orjson_hook)
+    return client
+
+
+def _single_timeout(timeout: Union[float, Tuple[float, float]]) -> float:
+    """Collapse a (connect, read) timeout into the one total TavilyClient accepts."""
+    return sum(timeout) if isinstance(timeout, tuple) else timeout
+
+
+def _classify(copies: List[Tuple[str, WebResult]]) -> str:
+    """
+    Pick the bucket for a URL from every (bucket, result) pair that returned it.
+    
+    A URL returned by a keyword bucket's own query goes to that bucket rather
+    than general_search. When several keyword buckets returned it, the one
+    whose keywords occur most often across all copies' titles and snippets
+    wins, with ties going to the earlier bucket.
+    """
+    returned_by = list(dict.fromkeys(bucket for bucket, _ in copies))
+    specific = [bucket for bucket in returned_by if bucket in _BUCKET_KEYWORDS]
+    if not specific:
+        return returned_by[0]
+    if len(specific) == 1:
+        return specific[0]
+    
+    text = ' '.join(f"{item.get('title', '')} {item.get('snippet', '')}" for _, item in copies).casefold()
+    
+    def hits(bucket: str) -> int:
+        return sum(text.count(word.casefold()) for word in _BUCKET_KEYWORDS[bucket].split(' OR '))
+    
+    # max() keeps the first of equal counts, i.e. the earlier bucket
+    return max(specific, key=hits)
 
 
 class WebSearcher:
     """Perform general web searches for a person using Tavily API."""
     
-    def __init__(self, tavily_api_key: str = None):
+    def __init__(self, tavily_api_key: str = None,
+                 timeout: Union[float, Tuple[float, float]] = 10.0,
+                 rate_limiter: RateLimiter = None,
+                 cache_dir: str = DEFAULT_CACHE_DIR):
         """
         Initialize the web searcher.
         
         Args:
             tavily_api_key: Optional API key for Tavily (recommended for best results)
+            timeout: HTTP timeout in seconds, or a (connect, read) tuple
+            rate_limiter: Limiter paced before every Tavily call
+                (default: the process-wide Tavily limiter)
+            cache_dir: Directory for memoized Tavily results
         """
         self.tavily_api_key = tavily_api_key
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or TAVILY_RATE_LIMITER
+        self.cache_dir = cache_dir
+        
+        # Created on first use and shared so its connection pool is reused
+        self._tavily = None
+        self._tavily_lock = threading.Lock()
+        
+        # Keep-alive connection pool for the basic (non-Tavily) search
+        self._session = pooled_session(
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        )
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        self._session.close()
+        if self._tavily is not None and hasattr(self._tavily, 'close'):
+            self._tavily.close()
+        self._tavily = None
+    
+    def _get_tavily(self):
+        """Return the shared TavilyClient, creating it on first use."""
+        # search_all calls in from several worker threads at once
+        with self._tavily_lock:
+            if self._tavily is None:
+                self._tavily = _tavily_client(self.tavily_api_key)
+            return self._tavily
     
     def search_tavily(self, person_name: str, max_results: int = 10, 
-                     additional_keywords: str = None) -> List[Dict]:
+                     additional_keywords: str = None) -> List[WebResult]:
         """
         Perform a search using Tavily API.
         
+        Falls back to a basic scrape when there is no API key or the Tavily
+        call fails; those fallback results are never cached.
+        
         Args:
             person_name: Full name of the person to search for
             max_results: Maximum number of results to return
             additional_keywords: Optional additional search terms
             
         Returns:
-            List of dictionaries containing search result information
+            List of WebResult records
+        """
+        return self._search_tavily(person_name, max_results, additional_keywords) or []
+    
+    def _search_tavily(self, person_name: str, max_results: int = 10,
+                       additional_keywords: str = None) -> Optional[List[WebResult]]:
+        """
+        search_tavily, but returns None if both Tavily and the fallback failed.
         """
-        results = []
-        
         if not self.tavily_api_key:
-            print("⚠ No Tavily API key provided. Using basic search (limited results).")
+            logger.warning("⚠ No Tavily API key provided. Using basic search (limited results).")
+            return self._search_basic(person_name, max_results, additional_keywords)
+        
+        results = self._search_tavily_api(person_name, max_results, additional_keywords)
+        if results is None:
+            logger.info("ℹ Falling back to basic search...")
             return self._search_basic(person_name, max_results, additional_keywords)
         
+        return results
+    
+    @single_flight(lambda self, person_name, max_results=10, additional_keywords=None:
+                   (self.tavily_api_key, name_key(person_name), max_results, additional_keywords))
+    @disk_memoize(ttl=3600, key_attrs=('tavily_api_key',), negative_ttl=86400)
+    def _search_tavily_api(self, person_name: str, max_results: int = 10,
+                           additional_keywords: str = None) -> Optional[List[WebResult]]:
+        """
+        Run a Tavily search. Returns None if the call failed.
+        """
+        results = []
         try:
-            from tavily import TavilyClient
-            
             query = f'"{person_name}"'
             if additional_keywords:
                 query += f" {additional_keywords}"
             
-            print(f"🔍 Searching with Tavily for: {query}")
+            logger.info("🔍 Searching with Tavily for: %s", query)
             
-            tavily_client = TavilyClient(api_key=self.tavily_api_key)
+            tavily_client = self._get_tavily()
             
-            response = tavily_client.search(
-                query=query,
-                max_results=max_results,
-                search_depth="advanced",  # Use advanced search for better results
-                include_raw_content=False
-            )
+            with self.rate_limiter:
+                response = tavily_client.search(
+                    query=query,
+                    max_results=max_results,
+                    search_depth="advanced",  # Use advanced search for better results
+                    include_raw_content=False,
+                    timeout=_single_timeout(self.timeout)
+                )
             
             if response and 'results' in response:
                 tavily_results = response['results']
-                print(f"✓ Found {len(tavily_results)} results")
+                logger.info("✓ Found %d results", len(tavily_results))
                 
                 for item in tavily_results:
-                    result_info = {
-                        'title': item.get('title', 'N/A'),
-                        'url': item.get('url', 'N/A'),
-                        'snippet': item.get('content', 'N/A'),
-                        'score': item.get('score', 0),
-                        'source': 'Tavily Search'
-                    }
+                    result_info = WebResult(
+                        title=item.get('title', 'N/A'),
+                        url=item.get('url', 'N/A'),
+                        snippet=item.get('content', 'N/A'),
+                        score=item.get('score', 0),
+                        source='Tavily Search'
+                    )
                     results.append(result_info)
-                    print(f"  🔗 {result_info['title']}")
+                    logger.info("  🔗 %s", result_info.title)
             else:
-                print(f"⚠ No results found")
+                logger.warning("⚠ No results found")
                 
         except ImportError:
-            print("❌ Tavily library not installed. Run: pip install tavily-python")
-            return self._search_basic(person_name, max_results, additional_keywords)
+            logger.error("❌ Tavily library not installed. Run: pip install tavily-python")
+            return None
         except Exception as e:
-            print(f"❌ Error with Tavily API: {e}")
-            print("ℹ Falling back to basic search...")
-            return self._search_basic(person_name, max_results, additional_keywords)
+            logger.error("❌ Error with Tavily API: %s", e)
+            return None
         
         return results
     
     def _search_basic(self, person_name: str, max_results: int = 10,
-                     additional_keywords: str = None) -> List[Dict]:
+                     additional_keywords: str = None) -> List[WebResult]:
         """
         Basic web search without API (web scraping).
         Fallback when Tavily API is not available.
@@ -92,64 +229,61 @@ class WebSearcher:
         """
         results = []
         try:
-            query = person_name.replace(' ', '+')
+            query = person_name
             if additional_keywords:
-                query += '+' + additional_keywords.replace(' ', '+')
-            
-            print(f"🔍 Performing basic web search for: {person_name}")
+                query += ' ' + additional_keywords
             
-            url = f"https://www.google.com/search?q={query}&num={max_results}"
+            logger.info("🔍 Performing basic web search for: %s", person_name)
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            url = "https://www.google.com/search?" + urlencode({'q': query, 'num': max_results})
             
-            response = requests.get(url, headers=headers, timeout=10)
+            with SCRAPE_RATE_LIMITER:
+                response = self._session.get(url, timeout=self.timeout)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                tree = LexborHTMLParser(response.text)
                 
                 # Find search result divs
-                search_results = soup.find_all('div', class_='g')[:max_results]
+                search_results = tree.css('div.g')[:max_results]
                 
                 if search_results:
-                    print(f"✓ Found {len(search_results)} results")
+                    logger.info("✓ Found %d results", len(search_results))
                     
                     for i, item in enumerate(search_results, 1):
                         try:
-                            title_elem = item.find('h3')
-                            title = title_elem.text if title_elem else 'N/A'
+                            title_elem = item.css_first('h3')
+                            title = title_elem.text() if title_elem else 'N/A'
                             
-                            link_elem = item.find('a')
-                            link = link_elem.get('href', 'N/A') if link_elem else 'N/A'
+                            link_elem = item.css_first('a')
+                            link = (link_elem.attributes.get('href') or 'N/A') if link_elem else 'N/A'
                             
-                            snippet_elem = item.find('div', class_='VwiC3b')
-                            if not snippet_elem:
-                                snippet_elem = item.find('span', class_='aCOpRe')
-                            snippet = snippet_elem.text if snippet_elem else 'N/A'
+                            snippet_elem = item.css_first('div.VwiC3b') or item.css_first('span.aCOpRe')
+                            snippet = snippet_elem.text() if snippet_elem else 'N/A'
                             
-                            result_info = {
-                                'title': title,
-                                'url': link,
-                                'snippet': snippet,
-                                'score': 1.0 - (i * 0.05),  # Simple relevance score
-                                'source': 'Basic Search'
-                            }
+                            result_info = WebResult(
+                                title=title,
+                                url=link,
+                                snippet=snippet,
+                                score=1.0 - (i * 0.05),  # Simple relevance score
+                                source='Basic Search'
+                            )
                             results.append(result_info)
-                            print(f"  🔗 {title}")
+                            logger.info("  🔗 %s", title)
                         except Exception as e:
                             continue
                 else:
-                    print(f"⚠ No results found")
+                    logger.warning("⚠ No results found")
             else:
-                print(f"❌ Error: HTTP {response.status_code}")
+                logger.error("❌ Error: HTTP %s", response.status_code)
+                return None
                 
         except Exception as e:
-            print(f"❌ Error in basic search: {e}")
+            logger.error("❌ Error in basic search: %s", e)
+            return None
         
         return results
     
-    def search_news(self, person_name: str, max_results: int = 5) -> List[Dict]:
+    def search_news(self, person_name: str, max_results: int = 5) -> List[WebResult]:
         """
         Search for news articles about a person using Tavily.
         
@@ -158,51 +292,60 @@ class WebSearcher:
             max_results: Maximum number of results to return
             
         Returns:
-            List of dictionaries containing news article information
+            List of WebResult records
         """
         if not self.tavily_api_key:
-            print("⚠ No Tavily API key. Skipping news search.")
+            logger.warning("⚠ No Tavily API key. Skipping news search.")
             return []
         
+        return self._search_news(person_name, max_results) or []
+    
+    @single_flight(lambda self, person_name, max_results=5:
+                   (self.tavily_api_key, name_key(person_name), max_results))
+    @disk_memoize(ttl=3600, key_attrs=('tavily_api_key',), negative_ttl=86400)
+    def _search_news(self, person_name: str, max_results: int = 5) -> Optional[List[WebResult]]:
+        """
+        Run a Tavily news search. Returns None if the call failed.
+        """
         try:
-            from tavily import TavilyClient
-            
-            print(f"🔍 Searching for news about {person_name}...")
+            logger.info("🔍 Searching for news about %s...", person_name)
             
-            tavily_client = TavilyClient(api_key=self.tavily_api_key)
+            tavily_client = self._get_tavily()
             
-            response = tavily_client.search(
-                query=f'"{person_name}" news OR article OR featured',
-                max_results=max_results,
-                search_depth="advanced",
-                topic="news"  # Focus on news content
-            )
+            with self.rate_limiter:
+                response = tavily_client.search(
+                    query=f'"{person_name}" news OR article OR featured',
+                    max_results=max_results,
+                    search_depth="advanced",
+                    topic="news",  # Focus on news content
+                    timeout=_single_timeout(self.timeout)
+                )
             
             results = []
             if response and 'results' in response:
                 tavily_results = response['results']
-                print(f"✓ Found {len(tavily_results)} news articles")
+                logger.info("✓ Found %d news articles", len(tavily_results))
                 
                 for item in tavily_results:
-                    article_info = {
-                        'title': item.get('title', 'N/A'),
-                        'url': item.get('url', 'N/A'),
-                        'snippet': item.get('content', 'N/A'),
-                        'score': item.get('score', 0),
-                        'source': 'Tavily News'
-                    }
+                    article_info = WebResult(
+                        title=item.get('title', 'N/A'),
+                        url=item.get('url', 'N/A'),
+                        snippet=item.get('content', 'N/A'),
+                        score=item.get('score', 0),
+                        source='Tavily News'
+                    )
                     results.append(article_info)
-                    print(f"  📰 {article_info['title']}")
+                    logger.info("  📰 %s", article_info.title)
             else:
-                print(f"⚠ No news articles found")
+                logger.warning("⚠ No news articles found")
             
             return results
             
         except Exception as e:
-            print(f"❌ Error searching news: {e}")
-            return []
+            logger.error("❌ Error searching news: %s", e)
+            return None
     
-    def search_academic(self, person_name: str, max_results: int = 5) -> List[Dict]:
+    def search_academic(self, person_name: str, max_results: int = 5) -> List[WebResult]:
         """
         Search for academic content and research mentions.
         
@@ -211,15 +354,15 @@ class WebSearcher:
             max_results: Maximum number of results to return
             
         Returns:
-            List of dictionaries containing academic content
+            List of WebResult records
         """
         return self.search_tavily(
             person_name, 
             max_results, 
-            additional_keywords="research OR paper OR publication OR scholar OR university"
+            additional_keywords=_BUCKET_KEYWORDS['academic']
         )
     
-    def search_social_media(self, person_name: str, platforms: List[str] = None) -> Dict[str, List[Dict]]:
+    def search_social_media(self, person_name: str, platforms: List[str] = None) -> Dict[str, List[WebResult]]:
         """
         Search for social media profiles and mentions.
         
@@ -230,6 +373,13 @@ class WebSearcher:
         Returns:
             Dictionary with platform names as keys and results as values
         """
+        return self._search_social_media(person_name, platforms) or {}
+    
+    def _search_social_media(self, person_name: str,
+                             platforms: List[str] = None) -> Optional[Dict[str, List[WebResult]]]:
+        """
+        search_social_media, but returns None if every platform search failed.
+        """
         if platforms is None:
             # Common platforms (excluding LinkedIn, X, GitHub as already scraped)
             platforms = [
@@ -240,31 +390,35 @@ class WebSearcher:
                 'youtube.com'
             ]
         
-        print(f"🔍 Searching social media platforms for {person_name}...")
+        logger.info("🔍 Searching social media platforms for %s...", person_name)
         
         results = {}
+        failures = 0
         for platform in platforms:
             try:
-                platform_results = self.search_tavily(
+                platform_results = self._search_tavily(
                     person_name,
                     max_results=3,
                     additional_keywords=f"site:{platform}"
                 )
                 
-                if platform_results:
+                if platform_results is None:
+                    failures += 1
+                elif platform_results:
                     results[platform] = platform_results
-                    print(f"  ✓ Found {len(platform_results)} results on {platform}")
+                    logger.info("  ✓ Found %d results on %s", len(platform_results), platform)
                 else:
-                    print(f"  ⚠ No results on {platform}")
-                
-                time.sleep(0.5)  # Be polite
+                    logger.warning("  ⚠ No results on %s", platform)
                 
             except Exception as e:
-                print(f"  ❌ Error searching {platform}: {e}")
+                failures += 1
+                logger.error("  ❌ Error searching %s: %s", platform, e)
         
+        if platforms and failures == len(platforms):
+            return None
         return results
     
-    def search_podcasts_interviews(self, person_name: str, max_results: int = 5) -> List[Dict]:
+    def search_podcasts_interviews(self, person_name: str, max_results: int = 5) -> List[WebResult]:
         """
         Search for podcast appearances and interviews.
         
@@ -273,18 +427,18 @@ class WebSearcher:
             max_results: Maximum number of results to return
             
         Returns:
-            List of dictionaries containing podcast/interview information
+            List of WebResult records
         """
-        print(f"🔍 Searching for podcasts and interviews featuring {person_name}...")
+        logger.info("🔍 Searching for podcasts and interviews featuring %s...", person_name)
         
         return self.search_tavily(
             person_name,
             max_results=max_results,
-            additional_keywords="podcast OR interview OR talk OR guest OR speaker"
+            additional_keywords=_BUCKET_KEYWORDS['podcasts_interviews']
         )
     
     def search_all(self, person_name: str, max_results: int = 10,
-                   include_social: bool = False) -> Dict[str, any]:
+                   include_social: bool = False, keep_failures: bool = False) -> Dict[str, any]:
         """
         Perform comprehensive web search for a person using Tavily.
         
@@ -292,19 +446,87 @@ class WebSearcher:
             person_name: Full name of the person to search for
             max_results: Maximum number of results per search type
             include_social: Whether to include social media search
+            keep_failures: Report a search that failed as None instead of an
+                empty result
             
         Returns:
             Dictionary with results from various search types
         """
+        return asyncio.run(self.search_all_async(person_name, max_results, include_social,
+                                                 keep_failures))
+    
+    async def search_all_async(self, person_name: str, max_results: int = 10,
+                               include_social: bool = False,
+                               keep_failures: bool = False) -> Dict[str, any]:
+        """
+        Perform comprehensive web search for a person, running searches concurrently.
+        
+        The Tavily client is synchronous, so each search runs in a worker
+        thread; the shared rate limiter keeps the combined request rate in
+        check. A URL returned for several buckets is kept only in one of them
+        (see _classify).
+        
+        Args:
+            person_name: Full name of the person to search for
+            max_results: Maximum number of results per search type
+            include_social: Whether to include social media search
+            keep_failures: Report a search that failed as None instead of an
+                empty result
+            
+        Returns:
+            Dictionary with results from various search types
+        """
+        specs = (
+            ('general_search', None, max_results),
+            ('academic', _BUCKET_KEYWORDS['academic'], 5),
+            ('podcasts_interviews', _BUCKET_KEYWORDS['podcasts_interviews'], 5)
+        )
+        
+        searches = [
+            asyncio.to_thread(self._search_tavily, person_name, limit, keywords)
+            for _, keywords, limit in specs
+        ]
+        # Without a key search_news just skips, which is not a failure
+        searches.append(asyncio.to_thread(self._search_news if self.tavily_api_key else self.search_news,
+                                          person_name, max_results=5))
+        if include_social:
+            searches.append(asyncio.to_thread(self._search_social_media, person_name))
+        
+        responses = await asyncio.gather(*searches)
+        
+        # Merge the Tavily queries by URL, then file each URL under one bucket
+        candidates = {}
+        for (bucket, _, _), items in zip(specs, responses):
+            for item in items or []:
+                # Scraped results can lack a link; never merge those
+                url = item.get('url')
+                key = url if url and url != 'N/A' else id(item)
+                candidates.setdefault(key, []).append((bucket, item))
+        
+        buckets = {bucket: [] for bucket, _, _ in specs}
+        for copies in candidates.values():
+            bucket = _classify(copies)
+            buckets[bucket].append(next(item for copy_bucket, item in copies if copy_bucket == bucket))
+        # A bucket's URLs only ever come from its own query, so a failed query
+        # leaves its bucket empty
+        for (bucket, _, _), items in zip(specs, responses):
+            if items is None:
+                buckets[bucket] = None
+        
         results = {
-            'general_search': self.search_tavily(person_name, max_results),
-            'news': self.search_news(person_name, max_results=5),
-            'academic': self.search_academic(person_name, max_results=5),
-            'podcasts_interviews': self.search_podcasts_interviews(person_name, max_results=5)
+            'general_search': buckets['general_search'],
+            'news': responses[len(specs)],
+            'academic': buckets['academic'],
+            'podcasts_interviews': buckets['podcasts_interviews']
         }
         
         if include_social:
-            results['social_media'] = self.search_social_media(person_name)
+            results['social_media'] = responses[len(specs) + 1]
+        
+        if not keep_failures:
+            for source, items in results.items():
+                if items is None:
+                    results[source] = {} if source == 'social_media' else []
         
         return results
 
@@ -315,26 +537,29 @@ if __name__ == "__main__":
     from dotenv import load_dotenv
     
     load_dotenv()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     
     tavily_api_key = os.getenv('TAVILY_API_KEY')
     searcher = WebSearcher(tavily_api_key=tavily_api_key)
-    
-    results = searcher.search_all("Aruzhan Abil", max_results=5, include_social=False)
-    
-    print("\n" + "="*80)
-    print("WEB SEARCH RESULTS")
-    print("="*80)
-    
-    for search_type, search_results in results.items():
-        if isinstance(search_results, list):
-            print(f"\n{search_type.upper().replace('_', ' ')}: {len(search_results)} results")
-            print("-"*80)
-            for i, result in enumerate(search_results, 1):
-                print(f"\n{i}. {result['title']}")
-                print(f"   URL: {result['url']}")
-                print(f"   Snippet: {result.get('snippet', 'N/A')[:100]}...")
-        else:
-            print(f"\n{search_type.upper().replace('_', ' ')}:")
-            print("-"*80)
-            for platform, items in search_results.items():
-                print(f"  {platform}: {len(items)} results")
+    try:
+        results = searcher.search_all("Aruzhan Abil", max_results=5, include_social=False)
+        
+        print("\n" + "="*80)
+        print("WEB SEARCH RESULTS")
+        print("="*80)
+        
+        for search_type, search_results in results.items():
+            if isinstance(search_results, list):
+                print(f"\n{search_type.upper().replace('_', ' ')}: {len(search_results)} results")
+                print("-"*80)
+                for i, result in enumerate(search_results, 1):
+                    print(f"\n{i}. {result['title']}")
+                    print(f"   URL: {result['url']}")
+                    print(f"   Snippet: {result.get('snippet', 'N/A')[:100]}...")
+            else:
+                print(f"\n{search_type.upper().replace('_', ' ')}:")
+                print("-"*80)
+                for platform, items in search_results.items():
+                    print(f"  {platform}: {len(items)} results")
+    finally:
+        searcher.close()
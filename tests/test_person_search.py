@@ -0,0 +1,64 @@
+"""
+Tests for cross-source result deduplication.
+"""
+import unittest
+
+from person_search import _dedupe, _dedupe_sources, _normalize_url
+
+
+class NormalizeUrlTest(unittest.TestCase):
+    
+    def test_drops_tracking_params_fragment_and_trailing_slash(self):
+        self.assertEqual(
+            _normalize_url(' HTTPS://Example.COM/news/story/?utm_source=x&id=7&fbclid=abc#top '),
+            'https://example.com/news/story?id=7'
+        )
+    
+    def test_malformed_url_is_compared_verbatim(self):
+        self.assertEqual(_normalize_url(' http://[broken '), 'http://[broken')
+    
+    def test_keeps_path_case_and_meaningful_params(self):
+        self.assertEqual(_normalize_url('https://example.com/A?b=1&ref=x'), 'https://example.com/A?b=1')
+
+
+class DedupeTest(unittest.TestCase):
+    
+    def test_drops_repeated_urls_and_reordered_titles(self):
+        items = [
+            {'title': 'Ada Lovelace wins award', 'url': 'https://example.com/a'},
+            {'title': 'Different headline here', 'url': 'https://EXAMPLE.com/a/?utm_medium=rss'},
+            {'title': 'Award wins Ada Lovelace', 'url': 'https://other.org/b'},
+            {'title': 'Unrelated story entirely', 'url': 'https://other.org/c'},
+        ]
+        unique = _dedupe(items, set())
+        self.assertEqual([item['url'] for item in unique], ['https://example.com/a', 'https://other.org/c'])
+    
+    def test_malformed_url_does_not_abort_the_batch(self):
+        items = [
+            {'title': 'Broken link', 'url': 'http://[broken'},
+            {'title': 'Broken link again', 'url': 'http://[broken'},
+            {'title': 'Working link', 'url': 'https://example.com/a'},
+        ]
+        self.assertEqual([item['title'] for item in _dedupe(items, set())], ['Broken link', 'Working link'])
+    
+    def test_missing_urls_and_short_titles_are_never_merged(self):
+        items = [
+            {'title': 'Talk', 'url': 'N/A'},
+            {'title': 'Talk', 'url': 'N/A'},
+        ]
+        self.assertEqual(len(_dedupe(items, set())), 2)
+    
+    def test_seen_spans_sources_including_nested_ones(self):
+        seen = set()
+        papers = _dedupe_sources({'arxiv': [{'title': 'A paper on engines', 'url': 'https://arxiv.org/abs/1'}]}, seen)
+        web = _dedupe_sources({
+            'general_search': [{'title': 'Mirror', 'url': 'https://arxiv.org/abs/1/'}],
+            'social_media': {'reddit.com': [{'title': 'Engines: a paper on', 'url': 'https://reddit.com/r/x'}]},
+        }, seen)
+        self.assertEqual(len(papers['arxiv']), 1)
+        self.assertEqual(web['general_search'], [])
+        self.assertEqual(web['social_media']['reddit.com'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
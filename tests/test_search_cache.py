@@ -0,0 +1,295 @@
+"""
+Tests for disk_memoize and single_flight.
+"""
+import asyncio
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from search_cache import (bypass_cache, clear_negative_cache, disk_memoize, recently_empty,
+                          remember_empty, single_flight)
+
+
+class DiskMemoizeTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = self._tmp.name
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_caches_by_normalized_name_and_key_attrs(self):
+        calls = []
+        cache_dir = self.cache_dir
+        
+        class Searcher:
+            def __init__(self, api_key):
+                self.api_key = api_key
+            
+            @disk_memoize(ttl=60, key_attrs=('api_key',), cache_dir=cache_dir)
+            def search(self, person_name, max_results=10):
+                calls.append((person_name, max_results))
+                return [person_name]
+        
+        searcher = Searcher('a')
+        self.assertEqual(searcher.search('Ada Lovelace'), ['Ada Lovelace'])
+        self.assertEqual(searcher.search('  ada   LOVELACE '), ['Ada Lovelace'])
+        searcher.search('Ada Lovelace', max_results=5)
+        Searcher('b').search('Ada Lovelace')
+        self.assertEqual(len(calls), 3)
+    
+    def test_instance_cache_dir_overrides_the_default(self):
+        calls = []
+        
+        class Searcher:
+            def __init__(self, cache_dir):
+                self.cache_dir = cache_dir
+            
+            @disk_memoize(ttl=60)
+            def search(self, person_name):
+                calls.append(self.cache_dir)
+                return [person_name]
+        
+        with tempfile.TemporaryDirectory() as other_dir:
+            Searcher(self.cache_dir).search('Ada Lovelace')
+            Searcher(self.cache_dir).search('Ada Lovelace')
+            Searcher(other_dir).search('Ada Lovelace')
+        self.assertEqual(calls, [self.cache_dir, other_dir])
+    
+    def test_empty_results_are_not_cached(self):
+        calls = []
+        
+        class Searcher:
+            @disk_memoize(ttl=60, cache_dir=self.cache_dir)
+            def search(self, person_name):
+                calls.append(person_name)
+                return []
+        
+        Searcher().search('Ada Lovelace')
+        Searcher().search('Ada Lovelace')
+        self.assertEqual(len(calls), 2)
+    
+    def test_negative_ttl_caches_empty_results_but_not_failures(self):
+        calls = []
+        outcomes = [None, [], ['late']]
+        
+        class Searcher:
+            @disk_memoize(ttl=60, cache_dir=self.cache_dir, negative_ttl=60)
+            def search(self, person_name):
+                calls.append(person_name)
+                return outcomes[len(calls) - 1]
+        
+        self.assertIsNone(Searcher().search('Ada Lovelace'))
+        self.assertEqual(Searcher().search('Ada Lovelace'), [])
+        self.assertEqual(Searcher().search('Ada Lovelace'), [])
+        self.assertEqual(len(calls), 2)
+    
+    def test_clear_negative_cache_keeps_non_empty_results(self):
+        calls = []
+        
+        class Searcher:
+            @disk_memoize(ttl=60, cache_dir=self.cache_dir, negative_ttl=60)
+            def search(self, person_name):
+                calls.append(person_name)
+                return [person_name] if person_name == 'Ada Lovelace' else []
+        
+        Searcher().search('Ada Lovelace')
+        Searcher().search('Nobody')
+        self.assertEqual(clear_negative_cache(self.cache_dir), 1)
+        Searcher().search('Ada Lovelace')
+        Searcher().search('Nobody')
+        self.assertEqual(calls, ['Ada Lovelace', 'Nobody', 'Nobody'])
+    
+    def test_remembered_empty_searches_share_the_negative_store(self):
+        key = ('uni', 'mit', 'ada lovelace')
+        self.assertFalse(recently_empty(key, self.cache_dir))
+        remember_empty(key, 60, self.cache_dir)
+        self.assertTrue(recently_empty(key, self.cache_dir))
+        with bypass_cache():
+            self.assertFalse(recently_empty(key, self.cache_dir))
+        self.assertEqual(clear_negative_cache(self.cache_dir), 1)
+        self.assertFalse(recently_empty(key, self.cache_dir))
+    
+    def test_bypass_cache_skips_stored_results_but_refreshes_them(self):
+        calls = []
+        
+        class Searcher:
+            @disk_memoize(ttl=60, cache_dir=self.cache_dir)
+            def search(self, person_name):
+                calls.append(person_name)
+                return [len(calls)]
+        
+        self.assertEqual(Searcher().search('Ada Lovelace'), [1])
+        with bypass_cache():
+            self.assertEqual(Searcher().search('Ada Lovelace'), [2])
+        self.assertEqual(Searcher().search('Ada Lovelace'), [2])
+    
+    def test_sync_and_async_share_entries(self):
+        calls = []
+        cache_dir = self.cache_dir
+        
+        class Searcher:
+            @disk_memoize(ttl=60, cache_dir=cache_dir, name='Searcher.search')
+            def search(self, person_name):
+                calls.append('sync')
+                return ['sync']
+            
+            @disk_memoize(ttl=60, cache_dir=cache_dir, name='Searcher.search', ignore=('session',))
+            async def search_async(self, session, person_name):
+                calls.append('async')
+                return ['async']
+        
+        searcher = Searcher()
+        self.assertEqual(asyncio.run(searcher.search_async(object(), 'Ada Lovelace')), ['async'])
+        self.assertEqual(asyncio.run(searcher.search_async(object(), 'Ada Lovelace')), ['async'])
+        self.assertEqual(searcher.search('Ada Lovelace'), ['async'])
+        self.assertEqual(calls, ['async'])
+
+
+class _JoinKey:
+    """
+    single_flight key that reports every caller who joins an in-flight call.
+    
+    The in-flight lookup only compares keys when an equal key is already
+    registered, and it does so while holding single_flight's lock, so by the
+    time `on_join` runs the caller is certain to share the leader's result.
+    That lets the tests hold the leader until all followers have joined
+    instead of sleeping and hoping they arrived in time.
+    """
+    
+    def __init__(self, name, on_join):
+        self.name = name
+        self.on_join = on_join
+    
+    def __hash__(self):
+        return hash(self.name)
+    
+    def __eq__(self, other):
+        if not isinstance(other, _JoinKey) or other.name != self.name:
+            return False
+        self.on_join()
+        return True
+
+
+class SingleFlightTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.joined = threading.Semaphore(0)
+    
+    def key(self, name):
+        return _JoinKey(name, self.joined.release)
+    
+    def wait_for_followers(self, count):
+        for _ in range(count):
+            self.assertTrue(self.joined.acquire(timeout=10))
+    
+    def test_threads_share_one_call(self):
+        calls = []
+        followers = 3
+        
+        @single_flight(self.key)
+        def search(name):
+            calls.append(name)
+            self.wait_for_followers(followers)
+            return [name]
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(search, 'a') for _ in range(4)]
+            results = [f.result() for f in futures]
+        
+        self.assertEqual(calls, ['a'])
+        self.assertEqual(results, [['a']] * 4)
+        # Nothing in flight any more, so the next call runs again
+        followers = 0
+        search('a')
+        self.assertEqual(calls, ['a', 'a'])
+    
+    def test_threads_share_exception(self):
+        @single_flight(self.key)
+        def search(name):
+            self.wait_for_followers(1)
+            raise ValueError(name)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(search, 'a') for _ in range(2)]
+            for future in futures:
+                with self.assertRaises(ValueError):
+                    future.result()
+    
+    def test_coroutines_on_one_loop_share_one_call(self):
+        calls = []
+        
+        @single_flight(lambda name: name)
+        async def search(name):
+            calls.append(name)
+            await asyncio.sleep(0.1)
+            return [name]
+        
+        async def main():
+            return await asyncio.gather(search('a'), search('a'), search('b'))
+        
+        self.assertEqual(asyncio.run(main()), [['a'], ['a'], ['b']])
+        self.assertEqual(calls, ['a', 'b'])
+    
+    def test_coroutines_across_event_loops_share_one_call(self):
+        calls = []
+        
+        @single_flight(self.key)
+        async def search(name):
+            calls.append(name)
+            await asyncio.to_thread(self.wait_for_followers, 2)
+            return [name]
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(asyncio.run, search('a')) for _ in range(3)]
+            results = [f.result() for f in futures]
+        
+        self.assertEqual(calls, ['a'])
+        self.assertEqual(results, [['a']] * 3)
+    
+    def test_follower_cancellation_leaves_leader_running(self):
+        calls = []
+        
+        @single_flight(lambda name: name)
+        async def search(name):
+            calls.append(name)
+            await asyncio.sleep(0.1)
+            return [name]
+        
+        async def main():
+            leader = asyncio.create_task(search('a'))
+            follower = asyncio.create_task(search('a'))
+            await asyncio.sleep(0)
+            follower.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await follower
+            return await leader
+        
+        self.assertEqual(asyncio.run(main()), ['a'])
+        self.assertEqual(calls, ['a'])
+    
+    def test_follower_takes_over_when_leader_is_cancelled(self):
+        calls = []
+        
+        @single_flight(lambda name: name)
+        async def search(name):
+            calls.append(name)
+            await asyncio.sleep(0.1)
+            return [name]
+        
+        async def main():
+            leader = asyncio.create_task(search('a'))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(search('a'))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+        
+        self.assertEqual(asyncio.run(main()), ['a'])
+        self.assertEqual(calls, ['a', 'a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Tests for the news searcher.
+"""
+import asyncio
+import tempfile
+import unittest
+from unittest import mock
+
+import search_news
+from search_news import NewsSearcher, _name_prefilter
+
+
+class NamePrefilterTest(unittest.TestCase):
+    
+    def test_matches_entity_encoded_punctuation(self):
+        pattern = _name_prefilter("Conan O'Brien")
+        self.assertIsNotNone(pattern.search(b'<a href="/a">Conan O&#39;Brien joins the faculty</a>'))
+    
+    def test_is_case_insensitive(self):
+        pattern = _name_prefilter('Ada Lovelace')
+        self.assertIsNotNone(pattern.search(b'<h1>ADA LOVELACE</h1>'))
+        self.assertIsNone(pattern.search(b'<h1>Charles Babbage</h1>'))
+    
+    def test_non_ascii_names_are_not_prefiltered(self):
+        self.assertIsNone(_name_prefilter('Zoë Chen'))
+        self.assertIsNone(_name_prefilter('---'))
+
+
+class _FakeGoogleSearch:
+    """Stands in for serpapi.GoogleSearch, returning one canned payload."""
+    
+    payload = {}
+    
+    def __init__(self, params):
+        self.params = params
+    
+    def get_dict(self):
+        return self.payload
+
+
+class SerpApiErrorTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.searcher = NewsSearcher(serpapi_key='key', cache_dir=self._tmp.name)
+        self.scrapes = []
+        self.searcher._search_google_news_basic = lambda name, n: self.scrapes.append(name) or []
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def search(self, payload):
+        with (mock.patch.object(search_news, 'GoogleSearch', _FakeGoogleSearch),
+              mock.patch.object(_FakeGoogleSearch, 'payload', payload)):
+            return self.searcher._google_news('Ada Lovelace')
+    
+    def test_error_payload_is_a_failure_and_not_remembered(self):
+        self.assertIsNone(self.search({'error': 'Your account has run out of searches.'}))
+        self.assertEqual(self.scrapes, ['Ada Lovelace'])
+        self.assertIsNone(self.search({'error': 'Your account has run out of searches.'}))
+        self.assertEqual(len(self.scrapes), 2)
+    
+    def test_successful_search_without_results_is_remembered(self):
+        payload = {
+            'search_metadata': {'status': 'Success'},
+            'error': "Google hasn't returned any results for this query."
+        }
+        self.assertEqual(self.search(payload), [])
+        self.assertEqual(self.search({'error': 'unreachable'}), [])
+        self.assertEqual(self.scrapes, [])
+
+
+
+class UniversityPageTest(unittest.TestCase):
+    
+    def test_malformed_anchor_is_skipped_not_fatal(self):
+        page = (
+            b'<a href="http://[broken">Ada Lovelace honoured at the spring gala</a>'
+            b'<a href="/2024/ada-lovelace">Ada Lovelace named honorary professor</a>'
+        )
+        
+        async def fake_fetch(session, url, allow_redirects=True):
+            return 200, page, 'utf-8'
+        
+        with (tempfile.TemporaryDirectory() as cache_dir,
+              mock.patch.object(search_news, 'fetch', fake_fetch)):
+            searcher = NewsSearcher(cache_dir=cache_dir)
+            articles = asyncio.run(searcher._fetch_one_uni(
+                None, asyncio.Semaphore(1), 'mit', 'https://news.mit.edu/search/',
+                'Ada Lovelace', 'Ada+Lovelace'))
+        
+        self.assertEqual([article.url for article in articles],
+                         ['https://news.mit.edu/2024/ada-lovelace'])
+
+
+if __name__ == '__main__':
+    unittest.main()
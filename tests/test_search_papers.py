@@ -0,0 +1,109 @@
+"""
+Tests for arXiv feed parsing and batched author matching.
+"""
+import contextlib
+import io
+import unittest
+
+from search_papers import PaperSearcher, _papers_by_author, _parse_arxiv_feed
+
+
+def _atom_feed(*entries):
+    """Build an arXiv Atom feed from (title, [authors], published) tuples."""
+    body = ''.join(
+        '<entry>'
+        f'<id>http://arxiv.org/abs/{i}</id>'
+        f'<title>{title}</title>'
+        f'<published>{published}</published>'
+        '<summary>An\n  abstract. </summary>'
+        + ''.join(f'<author><name>{name}</name></author>' for name in authors) +
+        '</entry>'
+        for i, (title, authors, published) in enumerate(entries)
+    )
+    return f'<feed xmlns="http://www.w3.org/2005/Atom">{body}</feed>'.encode('utf-8')
+
+
+class _FakeSession:
+    """Stands in for requests.Session, answering every GET with one feed."""
+    
+    def __init__(self, feed):
+        self.feed = feed
+        self.urls = []
+    
+    @contextlib.contextmanager
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        response = type('Response', (), {})()
+        response.status_code = 200
+        response.raw = io.BytesIO(self.feed)
+        yield response
+    
+    def close(self):
+        pass
+
+
+class ParseArxivFeedTest(unittest.TestCase):
+    
+    def test_parses_entries_and_collapses_whitespace(self):
+        papers = _parse_arxiv_feed(_atom_feed(
+            ('A  multi-line\n   title', ['Ada Lovelace', 'Charles Babbage'], '2021-03-04T00:00:00Z')
+        ))
+        self.assertEqual(len(papers), 1)
+        paper = papers[0]
+        self.assertEqual(paper.title, 'A multi-line title')
+        self.assertEqual(paper.authors, 'Ada Lovelace, Charles Babbage')
+        self.assertEqual(paper.year, '2021')
+        self.assertEqual(paper.abstract, 'An abstract.')
+        self.assertEqual(paper.url, 'http://arxiv.org/abs/0')
+
+
+class PapersByAuthorTest(unittest.TestCase):
+    
+    def test_matches_exact_names_only(self):
+        papers = _parse_arxiv_feed(_atom_feed(
+            ('One', ['Wei Lin'], '2020'),
+            ('Two', ['  wei   LI '], '2020'),
+            ('Three', ['Ada Lovelace', 'Wei Li'], '2020')
+        ))
+        results = _papers_by_author(papers, ['Wei Li', 'Ada Lovelace'], 10)
+        self.assertEqual([p.title for p in results['Wei Li']], ['Two', 'Three'])
+        self.assertEqual([p.title for p in results['Ada Lovelace']], ['Three'])
+    
+    def test_caps_papers_per_person(self):
+        papers = _parse_arxiv_feed(_atom_feed(*[(f'P{i}', ['Wei Li'], '2020') for i in range(5)]))
+        results = _papers_by_author(papers, ['Wei Li', 'Ada Lovelace'], 2)
+        self.assertEqual([p.title for p in results['Wei Li']], ['P0', 'P1'])
+        self.assertEqual(results['Ada Lovelace'], [])
+
+
+class SearchArxivBatchTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.searcher = PaperSearcher()
+        self.refilled = []
+        self.searcher.search_arxiv = lambda name, n: self.refilled.append(name) or [f'{name} alone']
+    
+    def tearDown(self):
+        self.searcher.close()
+    
+    def test_refills_people_crowded_out_of_a_full_feed(self):
+        # Two names, one result each: a feed of two entries is full
+        self.searcher._session = _FakeSession(_atom_feed(
+            ('One', ['Wei Li'], '2020'),
+            ('Two', ['Wei Li'], '2020')
+        ))
+        results = self.searcher.search_arxiv_batch(['Wei Li', 'Ada Lovelace'], 1)
+        self.assertEqual([p.title for p in results['Wei Li']], ['One'])
+        self.assertEqual(results['Ada Lovelace'], ['Ada Lovelace alone'])
+        self.assertEqual(self.refilled, ['Ada Lovelace'])
+    
+    def test_short_feed_is_not_refilled(self):
+        self.searcher._session = _FakeSession(_atom_feed(('One', ['Wei Li'], '2020')))
+        results = self.searcher.search_arxiv_batch(['Wei Li', 'Ada Lovelace'], 1)
+        self.assertEqual([p.title for p in results['Wei Li']], ['One'])
+        self.assertEqual(results['Ada Lovelace'], [])
+        self.assertEqual(self.refilled, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Tests for filing merged Tavily results into search_all buckets.
+"""
+import unittest
+
+from search_web import WebResult, _classify
+
+
+def _result(title, snippet=''):
+    return WebResult(title=title, url='https://example.com/x', snippet=snippet, score=1.0,
+                     source='Tavily Search')
+
+
+class ClassifyTest(unittest.TestCase):
+    
+    def test_general_only_stays_general(self):
+        self.assertEqual(_classify([('general_search', _result('Home page'))]), 'general_search')
+    
+    def test_keyword_bucket_beats_general(self):
+        copies = [('general_search', _result('Home page')), ('academic', _result('Home page'))]
+        self.assertEqual(_classify(copies), 'academic')
+    
+    def test_most_keyword_hits_across_copies_wins(self):
+        copies = [
+            ('academic', _result('Guest talk', 'University research')),
+            ('podcasts_interviews', _result('Guest talk', 'Podcast interview with the speaker')),
+        ]
+        self.assertEqual(_classify(copies), 'podcasts_interviews')
+    
+    def test_ties_go_to_the_earlier_bucket(self):
+        copies = [
+            ('academic', _result('Research podcast')),
+            ('podcasts_interviews', _result('Research podcast')),
+        ]
+        self.assertEqual(_classify(copies), 'academic')
+
+
+if __name__ == '__main__':
+    unittest.main()